@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+import maya_stand_in
+maya_stand_in.install()
+
+from AttributeEntry import AttributeEntry
+from NodeEntry import NodeEntry
+
+
+def get_plugs(node):
+    """List the plugs and attributes of every attribute of a node.
+
+    @param node The node to list the plugs of.
+    @return A list of (plug, attribute) pairs.
+    """
+    depend_fn = maya_stand_in.MFnDependencyNode(node)
+    return [(depend_fn.findPlug(depend_fn.attribute(index), True), depend_fn.attribute(index))
+            for index in range(depend_fn.attributeCount())]
+
+
+def benchmark(node_count, attribute_count, repeat):
+    """Time reading the attributes of nodes of one type, resolving readers every time and from the descriptor cache.
+
+    @param node_count The number of nodes read.
+    @param attribute_count The number of extra numeric attributes on each node.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best times in seconds of reading values alone, resolved and cached, and of listing the attribute
+            entries of every node, described per node and from the node type's cached descriptors.
+    """
+    # Nodes of a type share the definitions of their static attributes.
+    attributes = maya_stand_in.create_transform_attributes(attribute_count)
+    nodes = [maya_stand_in.create_node(name="transform%d" % index, attributes=attributes)
+             for index in range(node_count)]
+    plugs = [pair for node in nodes for pair in get_plugs(node)]
+
+    def read_resolved():
+        for plug, attribute in plugs:
+            AttributeEntry.get_attribute_value(plug, attribute)
+
+    def read_cached():
+        for plug, attribute in plugs:
+            AttributeEntry.get_descriptor("transform", plug, attribute).reader(plug, attribute)
+
+    def list_resolved():
+        for node in nodes:
+            AttributeEntry.clear_descriptors()
+            NodeEntry(node).get_attribute_entries()
+
+    def list_cached():
+        for node in nodes:
+            NodeEntry(node).get_attribute_entries()
+
+    times = []
+    for function in (read_resolved, read_cached, list_resolved, list_cached):
+        AttributeEntry.clear_descriptors()
+        times.append(min(timeit.repeat(function, number=1, repeat=repeat)))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares resolving attribute readers on every read against caching "
+                                                 "them in descriptors per node type and attribute")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=3)
+    parser.add_argument("-n", "--nodes", help="Number of nodes read", type=int, default=500)
+    parser.add_argument("-a", "--attributes", help="Numbers of extra attributes per node", type=int, nargs="+",
+                        default=[0, 100, 400])
+    parsed_args = parser.parse_args()
+
+    for attribute_count in parsed_args.attributes:
+        read_resolved, read_cached, list_resolved, list_cached = benchmark(parsed_args.nodes, attribute_count,
+                                                                           parsed_args.repeat)
+        print("{0:>4} extra attributes  read {1:8.2f} ms -> {2:8.2f} ms ({3:.1f}x)  "
+              "entries {4:8.2f} ms -> {5:8.2f} ms ({6:.1f}x)".format(
+                  attribute_count, read_resolved * 1e3, read_cached * 1e3, read_resolved / read_cached,
+                  list_resolved * 1e3, list_cached * 1e3, list_resolved / list_cached))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+import maya_stand_in
+maya_stand_in.install()
+
+from AttributeEntry import AttributeEntry
+
+
+def create_nested_compound_attribute(name, depth, width):
+    """Create a compound attribute nested to the given depth, with numeric attributes as its leaves.
+
+    @param name The name of the attribute.
+    @param depth The number of compound levels above the leaves.
+    @param width The number of children of every compound.
+    @return The attribute.
+    """
+    if depth == 0:
+        return maya_stand_in.create_numeric_attribute(name, default=1.0)
+    return maya_stand_in.create_compound_attribute(name, [create_nested_compound_attribute("%s_%d" % (name, index),
+                                                                                           depth - 1, width)
+                                                          for index in range(width)])
+
+
+def read_with_entries(plug, attribute):
+    """Read a compound the way compounds used to be read, creating an attribute entry for every child.
+
+    @param plug The plug of the compound.
+    @param attribute The attribute of the compound.
+    @return A dictionary of the values of the children by name.
+    """
+    compound_fn = maya_stand_in.MFnCompoundAttribute(attribute)
+    value = {}
+    for child_index in range(compound_fn.numChildren()):
+        child_attribute = compound_fn.child(child_index)
+        child_plug = maya_stand_in.MPlug(plug.node(), child_attribute)
+        child_entry = AttributeEntry(child_plug, child_attribute)
+        if child_plug.isCompound():
+            value[child_entry.attribute_name] = read_with_entries(child_plug, child_attribute)
+        else:
+            value[child_entry.attribute_name] = child_entry.get_value()
+    return value
+
+
+def benchmark(depth, width, repeat):
+    """Time reading a nested compound with an entry per child and with the compound reader.
+
+    @param depth The number of compound levels above the leaves.
+    @param width The number of children of every compound.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best times in seconds of reading with entries and with the compound reader.
+    """
+    # Compounds of every depth share their name, so descriptors of earlier runs are cleared.
+    AttributeEntry.clear_descriptors()
+    attribute = create_nested_compound_attribute("compound", depth, width)
+    node = maya_stand_in.create_node(attributes=[attribute])
+    plug = maya_stand_in.MPlug(node, attribute)
+    reader = AttributeEntry.get_descriptor("transform", plug, attribute).reader
+    assert reader(plug, attribute) == read_with_entries(plug, attribute)
+
+    functions = [lambda: read_with_entries(plug, attribute), lambda: reader(plug, attribute)]
+    return [min(timeit.repeat(function, number=1, repeat=repeat)) for function in functions]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares reading nested compound attributes through an attribute "
+                                                 "entry per child against reading them with the compound reader")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=5)
+    parser.add_argument("-w", "--width", help="Number of children of every compound", type=int, default=3)
+    parser.add_argument("-d", "--depths", help="Depths of the nested compounds", type=int, nargs="+",
+                        default=[2, 4, 6])
+    parsed_args = parser.parse_args()
+
+    for depth in parsed_args.depths:
+        with_entries, with_reader = benchmark(depth, parsed_args.width, parsed_args.repeat)
+        print("depth {0:>2}, {1:>6} leaves  read {2:8.2f} ms -> {3:8.2f} ms ({4:.1f}x)".format(
+            depth, parsed_args.width ** depth, with_entries * 1e3, with_reader * 1e3, with_entries / with_reader))
+
+
+if __name__ == "__main__":
+    main()
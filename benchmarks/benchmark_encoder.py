@@ -0,0 +1,72 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import timeit
+from collections import OrderedDict
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+from File import File
+
+
+def create_data(leaf_count, branching=10):
+    """Create a nested structure of dictionaries and lists holding the given number of leaf values.
+
+    @param leaf_count The number of scalar values in the structure.
+    @param branching The number of values held by each innermost container.
+    @return The root dictionary.
+    """
+    root = OrderedDict()
+    for group_index in range(max(1, leaf_count // (branching * branching))):
+        group = OrderedDict()
+        for item_index in range(branching):
+            group["item%d" % item_index] = [float(value) / 3 for value in range(branching)]
+        root["group%d" % group_index] = group
+    return root
+
+
+def benchmark(leaf_count, include_indentation, repeat):
+    """Time encoding the given number of leaf values and writing them to a temporary file.
+
+    @param leaf_count The number of scalar values to encode.
+    @param include_indentation Whether indentation is enabled.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best time in seconds.
+    """
+    data = create_data(leaf_count)
+    encoder = File.get_encoder(include_indentation, 4)
+    path = os.path.join(tempfile.gettempdir(), "benchmark_encoder.json")
+
+    def run():
+        with io.open(path, 'w', encoding='utf-8') as f:
+            for chunk in encoder.iterencode(data):
+                f.write(chunk if not isinstance(chunk, bytes) else chunk.decode('utf-8'))
+
+    try:
+        return min(timeit.repeat(run, number=1, repeat=repeat))
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures how streaming encoding scales with the number of values")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=3)
+    parser.add_argument("-m", "--maximum", help="Largest number of leaf values", type=int, default=1000000)
+    parsed_args = parser.parse_args()
+
+    leaf_count = 1000
+    while leaf_count <= parsed_args.maximum:
+        for include_indentation in (False, True):
+            seconds = benchmark(leaf_count, include_indentation, parsed_args.repeat)
+            print("{0:>9} values  indentation={1:<5}  {2:9.4f} s  {3:7.3f} us/value".format(
+                leaf_count, str(include_indentation), seconds, seconds / leaf_count * 1e6))
+        leaf_count *= 10
+
+
+if __name__ == "__main__":
+    main()
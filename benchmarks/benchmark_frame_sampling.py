@@ -0,0 +1,95 @@
+import argparse
+import math
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+import maya_stand_in
+maya_stand_in.install()
+
+from AttributeEntry import AttributeEntry
+from NodeEntry import NodeEntry
+
+
+def create_animated_node(attribute_count):
+    """Create a node whose numeric attributes are all animated.
+
+    @param attribute_count The number of animated attributes.
+    @return The node.
+    """
+    attributes = [maya_stand_in.create_numeric_attribute("attribute%d" % index) for index in range(attribute_count)]
+    node = maya_stand_in.create_node(attributes=attributes)
+    for index, attribute in enumerate(attributes):
+        node.values[attribute.name] = maya_stand_in.Curve(lambda time, offset=index: math.sin(time * 0.1 + offset))
+    return node
+
+
+def sample_by_scrubbing(node, frames):
+    """Sample a node the way it used to be done, setting the current time and adding the node again at every frame.
+
+    @param node The node to sample.
+    @param frames The frames to sample at.
+    @return A list of the values of every attribute, by frame.
+    """
+    samples = []
+    for frame in frames:
+        maya_stand_in.MAnimControl.setCurrentTime(maya_stand_in.MTime(frame))
+        samples.append([entry.value for entry in NodeEntry(node).get_attribute_entries()])
+    return samples
+
+
+def sample_by_attribute(entries, frames):
+    """Sample every attribute entry over the whole frame range before moving on to the next entry.
+
+    @param entries The attribute entries to sample.
+    @param frames The frames to sample at.
+    @return A list of the samples of every entry.
+    """
+    return [entry.sample_value(frames) for entry in entries]
+
+
+def benchmark(frame_count, attribute_count, repeat):
+    """Time sampling the attributes of a node by scrubbing, by attribute and batched by frame.
+
+    @param frame_count The number of frames sampled.
+    @param attribute_count The number of animated attributes of the node.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best times in seconds of sampling by scrubbing, by attribute and batched by frame.
+    """
+    AttributeEntry.clear_descriptors()
+    node = create_animated_node(attribute_count)
+    node_entry = NodeEntry(node)
+    entries = node_entry.get_attribute_entries()
+    frames = [float(frame) for frame in range(1, frame_count + 1)]
+    batched = node_entry.get_attribute_samples(frames)
+    assert list(batched.values()) == sample_by_attribute(entries, frames)
+    assert [list(x) for x in zip(*batched.values())] == sample_by_scrubbing(node, frames)
+
+    functions = [lambda: sample_by_scrubbing(node, frames), lambda: sample_by_attribute(entries, frames),
+                 lambda: AttributeEntry.get_samples(entries, frames)]
+    return [min(timeit.repeat(function, number=1, repeat=repeat)) for function in functions]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares sampling attributes over a frame range by scrubbing the "
+                                                 "timeline, by attribute and batched by frame")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=3)
+    parser.add_argument("-f", "--frames", help="Number of frames sampled", type=int, default=1000)
+    parser.add_argument("-a", "--attributes", help="Numbers of animated attributes", type=int, nargs="+",
+                        default=[10, 100])
+    parsed_args = parser.parse_args()
+
+    for attribute_count in parsed_args.attributes:
+        scrubbing, by_attribute, batched = benchmark(parsed_args.frames, attribute_count, parsed_args.repeat)
+        print("{0:>5} frames x {1:>4} attributes  scrubbing {2:8.2f} ms  by attribute {3:8.2f} ms  "
+              "batched {4:8.2f} ms ({5:.1f}x)".format(parsed_args.frames, attribute_count, scrubbing * 1e3,
+                                                      by_attribute * 1e3, batched * 1e3, scrubbing / batched))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+from Entry import Entry
+from File import File
+
+
+def create_file(entry_count, branching=10):
+    """Create a file holding the given number of entries, nested in groups.
+
+    @param entry_count The number of entries in the file.
+    @param branching The number of children held by each group entry.
+    @return The file and a list of its leaf entries.
+    """
+    json_file = File()
+    groups = [None]
+    leaves = []
+    for index in range(entry_count):
+        entry = Entry("entry%d" % index)
+        entry.parent = groups[index // branching]
+        entry.position = index % branching
+        if index < entry_count // branching:
+            entry.value = {}
+            groups.append(entry)
+        else:
+            entry.value = float(index)
+            leaves.append(entry)
+        json_file.add_entry(entry)
+    return json_file, leaves
+
+
+def benchmark(entry_count, include_indentation, repeat):
+    """Time refreshing the encoded text of a file after editing a single entry.
+
+    @param entry_count The number of entries in the file.
+    @param include_indentation Whether indentation is enabled.
+    @param repeat The number of timed edits, of which the best is reported.
+    @return The best times in seconds of a full encode and of an incremental refresh.
+    """
+    json_file, leaves = create_file(entry_count)
+    full = min(timeit.repeat(lambda: "".join(json_file.iterencode(include_indentation, 4)), number=1, repeat=repeat))
+    json_file.encode(include_indentation, 4)
+
+    def edit():
+        leaf = leaves[len(leaves) // 2]
+        leaf.value += 1
+        json_file.update_entry(leaf)
+        json_file.encode(include_indentation, 4)
+
+    return full, min(timeit.repeat(edit, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares full encoding against refreshing after a single edit")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=5)
+    parser.add_argument("-m", "--maximum", help="Largest number of entries", type=int, default=100000)
+    parsed_args = parser.parse_args()
+
+    entry_count = 1000
+    while entry_count <= parsed_args.maximum:
+        for include_indentation in (False, True):
+            full, incremental = benchmark(entry_count, include_indentation, parsed_args.repeat)
+            print("{0:>7} entries  indentation={1:<5}  full {2:8.2f} ms  single edit {3:8.2f} ms".format(
+                entry_count, str(include_indentation), full * 1e3, incremental * 1e3))
+        entry_count *= 10
+
+
+if __name__ == "__main__":
+    main()
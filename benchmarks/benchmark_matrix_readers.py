@@ -0,0 +1,87 @@
+import argparse
+import os
+import random
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+import maya_stand_in
+maya_stand_in.install()
+
+from AttributeEntry import AttributeEntry
+from EntryEncoder import EntryEncoder
+
+
+def create_matrix_array_plug(matrix_count):
+    """Create a plug holding an array of random matrices.
+
+    @param matrix_count The number of matrices in the array.
+    @return The plug and its attribute.
+    """
+    attribute = maya_stand_in.create_typed_attribute("matrices", maya_stand_in.MFnData.kMatrixArray)
+    node = maya_stand_in.create_node(attributes=[attribute])
+    node.values["matrices"] = maya_stand_in.MMatrixArray(
+        [maya_stand_in.MMatrix([[random.random() for _ in range(4)] for _ in range(4)]) for _ in range(matrix_count)])
+    return maya_stand_in.MPlug(node, attribute), attribute
+
+
+def read_nested_lists(plug):
+    """Read a matrix array the way matrices used to be read, as nested lists filled element by element.
+
+    @param plug The plug of the matrix array.
+    @return A list of 4 by 4 nested lists.
+    """
+    matrices = maya_stand_in.MFnMatrixArrayData(plug.asMObject()).array()
+    values = []
+    for index in range(matrices.length()):
+        matrix = matrices[index]
+        matrix_multi_array = [[[] for i in range(4)] for i in range(4)]
+        for x in range(4):
+            for y in range(4):
+                matrix_multi_array[x][y] = matrix(x, y)
+        values.append(matrix_multi_array)
+    return values
+
+
+def benchmark(matrix_count, repeat):
+    """Time reading and encoding a matrix array as nested lists and as a flat typed array.
+
+    @param matrix_count The number of matrices in the array.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best times in seconds of reading as nested lists, reading as a typed array, encoding the nested lists
+            and encoding the typed array.
+    """
+    plug, attribute = create_matrix_array_plug(matrix_count)
+    reader = AttributeEntry.get_descriptor("transform", plug, attribute).reader
+    nested_lists = read_nested_lists(plug)
+    typed_array = reader(plug, attribute)
+    assert typed_array.tolist() == nested_lists
+
+    encoder = EntryEncoder()
+    functions = [lambda: read_nested_lists(plug), lambda: reader(plug, attribute),
+                 lambda: encoder.encode(nested_lists), lambda: encoder.encode(typed_array)]
+    return [min(timeit.repeat(function, number=1, repeat=repeat)) for function in functions]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares reading matrix arrays into nested lists against reading "
+                                                 "them into a flat typed array")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=5)
+    parser.add_argument("-m", "--matrices", help="Numbers of matrices per array", type=int, nargs="+",
+                        default=[1000, 10000])
+    parsed_args = parser.parse_args()
+
+    for matrix_count in parsed_args.matrices:
+        read_lists, read_typed, encode_lists, encode_typed = benchmark(matrix_count, parsed_args.repeat)
+        print("{0:>7} matrices  read {1:8.2f} ms -> {2:8.2f} ms ({3:.1f}x)  "
+              "encode {4:8.2f} ms -> {5:8.2f} ms ({6:.1f}x)".format(
+                  matrix_count, read_lists * 1e3, read_typed * 1e3, read_lists / read_typed,
+                  encode_lists * 1e3, encode_typed * 1e3, encode_lists / encode_typed))
+
+
+if __name__ == "__main__":
+    main()
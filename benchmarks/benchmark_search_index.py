@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+from SearchIndex import SearchIndex
+
+
+def create_index(node_count, attribute_count):
+    """Create a search index of "node.attribute" paths.
+
+    @param node_count The number of nodes, each indexed as a group.
+    @param attribute_count The number of attributes of each node.
+    @return The search index.
+    """
+    search_index = SearchIndex()
+    for node_index in range(node_count):
+        node = "node%d" % node_index
+        search_index.add_group(node, [((node, row), "%s.attribute%d" % (node, row)) for row in range(attribute_count)])
+    return search_index
+
+
+def benchmark(node_count, attribute_count, repeat):
+    """Time a keystroke extending the search term, which narrows the previous matches, against scanning every path.
+
+    @param node_count The number of nodes indexed.
+    @param attribute_count The number of attributes of each node.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return The best times in seconds of the keystroke when scanning every path and when narrowing.
+    """
+    search_index = create_index(node_count, attribute_count)
+    scanning = min(timeit.repeat(lambda: search_index.search("node123"), lambda: search_index.search("x"),
+                                 number=1, repeat=repeat))
+    narrowing = min(timeit.repeat(lambda: search_index.search("node123"), lambda: search_index.search("node12"),
+                                  number=1, repeat=repeat))
+    return scanning, narrowing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares narrowing the matches of a search index as a term is "
+                                                 "typed against scanning every path")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per size", type=int, default=5)
+    parser.add_argument("-a", "--attributes", help="Number of attributes of each node", type=int, default=100)
+    parser.add_argument("-n", "--nodes", help="Numbers of nodes", type=int, nargs="+", default=[100, 1000, 10000])
+    parsed_args = parser.parse_args()
+
+    for node_count in parsed_args.nodes:
+        scanning, narrowing = benchmark(node_count, parsed_args.attributes, parsed_args.repeat)
+        print("{0:>8} paths  scanning {1:8.2f} ms  narrowing {2:8.2f} ms ({3:.1f}x)  frame budget {4:.2f} ms".format(
+            node_count * parsed_args.attributes, scanning * 1e3, narrowing * 1e3, scanning / narrowing, 1e3 / 60))
+
+
+if __name__ == "__main__":
+    main()
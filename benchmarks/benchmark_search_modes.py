@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import timeit
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+from SearchIndex import SearchIndex
+
+ATTRIBUTE_NAMES = ["translate", "rotate", "scale", "shear", "visibility", "inheritsTransform", "rotatePivot",
+                   "scalePivot", "offsetParentMatrix", "displayHandle"]
+QUERIES = [("substring", "translatex"), ("glob", "*.rotate?"), ("glob", "pcube1*.scale*"),
+           ("regex", r"rotate[xy]$"), ("fuzzy", "c1rpx")]
+
+
+def create_index(item_count):
+    """Create a search index of "node.attribute" paths, fifty attributes to a node.
+
+    @param item_count The number of attribute paths indexed.
+    @return The search index.
+    """
+    search_index = SearchIndex()
+    attribute_names = [name + axis for name in ATTRIBUTE_NAMES for axis in ["", "X", "Y", "Z", "W"]]
+    for node_index in range(item_count // len(attribute_names)):
+        node = "pCube%d" % node_index
+        search_index.add_group(node, [((node, row), node + "." + attribute_name)
+                                      for row, attribute_name in enumerate(attribute_names)])
+    return search_index
+
+
+def benchmark(item_count, repeat):
+    """Time the queries of every search mode against an index of the given size.
+
+    @param item_count The number of attribute paths indexed.
+    @param repeat The number of timed runs, of which the best is reported.
+    @return A list of (mode, term, match count, times) tuples, with the best times in seconds of searching all paths,
+    of typing the last character of the term, and of ranking the best match.
+    """
+    search_index = create_index(item_count)
+    results = []
+    for mode, term in QUERIES:
+        times = [min(timeit.repeat(lambda: search_index.search(term, mode), lambda: search_index.search(""),
+                                   number=1, repeat=repeat)),
+                 min(timeit.repeat(lambda: search_index.search(term, mode), lambda: search_index.search(term[:-1], mode),
+                                   number=1, repeat=repeat))]
+        times.append(min(timeit.repeat(lambda: search_index.get_ranked_items(1), number=1, repeat=repeat)))
+        results.append((mode, term, len(search_index.matches), times))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times search queries of every mode against search indexes of "
+                                                 "increasing size")
+    parser.add_argument("-r", "--repeat", help="Number of timed runs per query", type=int, default=5)
+    parser.add_argument("-s", "--sizes", help="Numbers of indexed attribute paths", type=int, nargs="+",
+                        default=[1000, 10000, 100000])
+    parsed_args = parser.parse_args()
+
+    for item_count in parsed_args.sizes:
+        for mode, term, match_count, times in benchmark(item_count, parsed_args.repeat):
+            print("{0:>7} paths  {1:<9} {2:<15} {3:>6} matches  search {4:7.2f} ms  keystroke {5:7.2f} ms  "
+                  "best match {6:7.2f} ms".format(item_count, mode, term, match_count, *[x * 1e3 for x in times]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import os
+import sys
+import timeit
+from collections import OrderedDict
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2 cannot trace allocations, so only times are measured there.
+    tracemalloc = None
+
+MODELS_DIRECTORY = os.path.normpath(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                                 "..", "src", "json_assembler", "models"))
+if MODELS_DIRECTORY not in sys.path:
+    sys.path.append(MODELS_DIRECTORY)
+
+from benchmark_incremental import create_file
+
+
+def preprocess_node(node):
+    """Build the intermediate value of an (entry, child nodes) pair the way files used to be preprocessed.
+
+    @param node The (entry, child nodes) pair.
+    @return The entry and its value, with children nested in dictionaries keyed by entry.
+    """
+    entry, child_nodes = node
+    if not child_nodes:
+        return entry, entry.value
+    elif isinstance(entry.value, list):
+        return entry, [dict([preprocess_node(x)]) for x in child_nodes]
+    else:
+        return entry, OrderedDict([preprocess_node(x) for x in child_nodes])
+
+
+def encode_preprocessed(json_file, encoder):
+    """Encode a file by building the intermediate dictionaries first.
+
+    @param json_file The file to encode.
+    @param encoder The encoder to use.
+    """
+    for _ in encoder.iterencode(OrderedDict([preprocess_node(x) for x in json_file.get_tree()])):
+        pass
+
+
+def encode_tree(json_file, encoder):
+    """Encode a file by walking its entries directly.
+
+    @param json_file The file to encode.
+    @param encoder The encoder to use.
+    """
+    for _ in encoder.iterencode_tree(json_file.get_tree()):
+        pass
+
+
+def measure(function, json_file, encoder):
+    """Measure the time and peak memory of an encoding function.
+
+    @param function The encoding function.
+    @param json_file The file to encode.
+    @param encoder The encoder to use.
+    @return The time in seconds and the peak memory in bytes, or None when allocations cannot be traced.
+    """
+    seconds = min(timeit.repeat(lambda: function(json_file, encoder), number=1, repeat=3))
+    if tracemalloc is None:
+        return seconds, None
+    tracemalloc.start()
+    function(json_file, encoder)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares encoding through intermediate dictionaries with "
+                                                 "encoding the entry tree directly")
+    parser.add_argument("-m", "--maximum", help="Largest number of entries", type=int, default=1000000)
+    parsed_args = parser.parse_args()
+
+    entry_count = 10000
+    while entry_count <= parsed_args.maximum:
+        json_file, _ = create_file(entry_count)
+        for include_indentation in (False, True):
+            encoder = json_file.get_encoder(include_indentation, 4)
+            for label, function in (("preprocessed", encode_preprocessed), ("tree", encode_tree)):
+                seconds, peak = measure(function, json_file, encoder)
+                print("{0:>8} entries  indentation={1:<5}  {2:<12}  {3:9.2f} ms  peak {4:>9} MB".format(
+                    entry_count, str(include_indentation), label, seconds * 1e3,
+                    "{0:.2f}".format(peak / 1e6) if peak is not None else "n/a"))
+        entry_count *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+"""A minimal stand-in for maya.OpenMaya, so that the models can be benchmarked outside of Maya.
+
+Only the parts of the API used by the models are provided. Nodes hold their attribute values in a dictionary, which
+keeps the stand-in far cheaper than the real API, so timings measure the overhead of the models themselves.
+"""
+import sys
+import types
+import uuid
+
+
+class MFn(object):
+    kInvalid = 0
+    kBase = 1
+    kDependencyNode = 4
+    kTransform = 110
+    kMesh = 296
+    kLocator = 281
+    kNurbsCurve = 267
+    kNurbsSurface = 294
+    kJoint = 121
+    kLight = 302
+    kLambert = 362
+    kCamera = 250
+    kSet = 460
+    kAttribute = 554
+    kNumericAttribute = 555
+    kUnitAttribute = 556
+    kDoubleLinearAttribute = 557
+    kDoubleAngleAttribute = 558
+    kTimeAttribute = 559
+    kEnumAttribute = 560
+    kTypedAttribute = 561
+    kCompoundAttribute = 562
+    kGenericAttribute = 563
+    kMatrixAttribute = 564
+
+
+class MFnNumericData(object):
+    kInvalid = 0
+    kBoolean = 1
+    kByte = 2
+    kChar = 3
+    kShort = 4
+    k2Short = 5
+    k3Short = 6
+    # As in Maya, kLong is an alias of kInt.
+    kInt = 7
+    kLong = 7
+    kInt64 = 8
+    kFloat = 11
+    kDouble = 14
+
+
+class MFnData(object):
+    kInvalid = 0
+    kNumeric = 1
+    kPlugin = 2
+    kPluginGeometry = 3
+    kString = 4
+    kMatrix = 5
+    kStringArray = 6
+    kDoubleArray = 7
+    kFloatArray = 8
+    kIntArray = 9
+    kPointArray = 10
+    kVectorArray = 11
+    kMatrixArray = 12
+    kComponentList = 13
+    kMesh = 14
+    kLattice = 15
+
+
+class MObject(object):
+
+    def __init__(self, api_type=MFn.kInvalid, fn_types=()):
+        self.api_type = api_type
+        self.fn_types = frozenset(fn_types) | frozenset([api_type])
+
+    def hasFn(self, fn_type):
+        return fn_type in self.fn_types
+
+    def apiType(self):
+        return self.api_type
+
+    def apiTypeStr(self):
+        for name, value in vars(MFn).items():
+            if value == self.api_type and name.startswith("k"):
+                return name
+        return "kInvalid"
+
+    def isNull(self):
+        return self.api_type == MFn.kInvalid
+
+
+class Attribute(MObject):
+    # Attribute definitions, holding everything the function sets report about them.
+
+    def __init__(self, name, api_type, data_type=None, default=None, children=(), fn_types=(), dynamic=False,
+                 hidden=False, keyable=True, array=False):
+        super(Attribute, self).__init__(api_type, tuple(fn_types) + (MFn.kAttribute,))
+        self.name = name
+        self.data_type = data_type
+        self.default = default
+        self.children = list(children)
+        self.dynamic = dynamic
+        self.hidden = hidden
+        self.keyable = keyable
+        self.array = array
+        self.parent = None
+        for child in self.children:
+            child.parent = self
+
+
+class Node(MObject):
+
+    def __init__(self, type_name, name, attributes, api_type=MFn.kDependencyNode):
+        super(Node, self).__init__(api_type, (MFn.kDependencyNode,))
+        self.type_name = type_name
+        self.name = name
+        self.uuid = str(uuid.uuid4()).upper()
+        self.attributes = list(attributes)
+        self.values = {}
+
+        # Children of compound attributes are counted as attributes of the node, as Maya does.
+        self.all_attributes = []
+        stack = list(reversed(self.attributes))
+        while stack:
+            attribute = stack.pop()
+            self.all_attributes.append(attribute)
+            stack.extend(reversed(attribute.children))
+
+
+class MUuid(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def asString(self):
+        return self.value
+
+
+class MAngle(object):
+
+    def __init__(self, value):
+        self._value = value
+
+    def value(self):
+        return self._value
+
+
+MDistance = MAngle
+
+
+class MTime(MAngle):
+    kFilm = 6
+
+    def __init__(self, value=0.0, unit=kFilm):
+        super(MTime, self).__init__(value)
+        self.unit = unit
+
+    @staticmethod
+    def uiUnit():
+        return MTime.kFilm
+
+
+class MDGContext(object):
+    # The context plugs are read in, which is the current time unless another context is made current.
+
+    current = None
+
+    def __init__(self, time=None):
+        self.time = time
+
+    def getTime(self):
+        return self.time if self.time is not None else MTime(MAnimControl.current_time)
+
+    def makeCurrent(self):
+        previous_context = MDGContext.current or MDGContext()
+        MDGContext.current = self
+        return previous_context
+
+
+class MAnimControl(object):
+    current_time = 1.0
+    min_time = 1.0
+    max_time = 120.0
+
+    @staticmethod
+    def currentTime():
+        return MTime(MAnimControl.current_time)
+
+    @staticmethod
+    def setCurrentTime(time):
+        MAnimControl.current_time = time.value()
+
+    @staticmethod
+    def minTime():
+        return MTime(MAnimControl.min_time)
+
+    @staticmethod
+    def maxTime():
+        return MTime(MAnimControl.max_time)
+
+
+class Curve(object):
+    # Animated values, evaluated at the time of the current context when their plug is read.
+
+    def __init__(self, function):
+        self.function = function
+
+    def evaluate(self, time):
+        return self.function(time)
+
+
+class MMatrix(object):
+
+    def __init__(self, rows=None):
+        self.rows = [list(row) for row in rows] if rows is not None else [[float(row == column) for column in range(4)]
+                                                                          for row in range(4)]
+
+    def __call__(self, row, column):
+        return self.rows[row][column]
+
+
+class MArray(object):
+    # Base of the array types, which are indexed and report their length through length().
+
+    def __init__(self, values=()):
+        self.values = list(values)
+
+    def length(self):
+        return len(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+
+class MMatrixArray(MArray):
+    pass
+
+
+class MIntArray(MArray):
+
+    def append(self, value):
+        self.values.append(value)
+
+    def clear(self):
+        self.values = []
+
+
+class MPlug(object):
+
+    # Values of array attributes are held by nodes as dictionaries keyed by logical index.
+
+    def __init__(self, node=None, attribute=None, logical_index=None):
+        self._node = node
+        self._attribute = attribute
+        self._logical_index = logical_index
+
+    def node(self):
+        return self._node
+
+    def attribute(self):
+        return self._attribute
+
+    def partialName(self, include_node_name=False, include_non_mandatory_indices=False,
+                    include_instanced_indices=False, use_alias=False, use_full_attribute_path=False,
+                    use_long_names=False):
+        return self._attribute.name
+
+    def name(self):
+        return self._node.name + "." + self._attribute.name
+
+    def isCompound(self):
+        return bool(self._attribute.children)
+
+    def numChildren(self):
+        return len(self._attribute.children)
+
+    def child(self, index):
+        return MPlug(self._node, self._attribute.children[index])
+
+    def isDynamic(self):
+        return self._attribute.dynamic
+
+    def isArray(self):
+        return self._attribute.array and self._logical_index is None
+
+    def isElement(self):
+        return self._logical_index is not None
+
+    def logicalIndex(self):
+        return self._logical_index
+
+    def getExistingArrayAttributeIndices(self, indices):
+        indices.clear()
+        for index in sorted(self._node.values.get(self._attribute.name, {})):
+            indices.append(index)
+        return len(indices)
+
+    def elementByLogicalIndex(self, index):
+        return MPlug(self._node, self._attribute, index)
+
+    def isKeyable(self):
+        return self._attribute.keyable
+
+    def isConnected(self):
+        return False
+
+    def get(self):
+        if self._logical_index is not None:
+            value = self._node.values.get(self._attribute.name, {}).get(self._logical_index, self._attribute.default)
+        else:
+            value = self._node.values.get(self._attribute.name, self._attribute.default)
+        if isinstance(value, Curve):
+            return value.evaluate((MDGContext.current or MDGContext()).getTime().value())
+        return value
+
+    def asBool(self):
+        return bool(self.get())
+
+    def asInt(self):
+        return int(self.get())
+
+    asChar = asInt
+    asShort = asInt
+    asInt64 = asInt
+
+    def asDouble(self):
+        return float(self.get())
+
+    asFloat = asDouble
+
+    def asString(self):
+        return self.get()
+
+    def asMAngle(self):
+        return MAngle(self.get())
+
+    def asMDistance(self):
+        return MDistance(self.get())
+
+    def asMTime(self):
+        return MTime(self.get())
+
+    def asMObject(self):
+        return self.get()
+
+
+class MFnBase(object):
+
+    def __init__(self, o=None):
+        self.o = o
+
+
+class MFnDependencyNode(MFnBase):
+
+    def name(self):
+        return self.o.name
+
+    def typeName(self):
+        return self.o.type_name
+
+    def uuid(self):
+        return MUuid(self.o.uuid)
+
+    def attributeCount(self):
+        return len(self.o.all_attributes)
+
+    def attribute(self, index):
+        return self.o.all_attributes[index]
+
+    def findPlug(self, attribute, want_networked_plug=True):
+        if not isinstance(attribute, Attribute):
+            attribute = next(x for x in self.o.all_attributes if x.name == attribute)
+        return MPlug(self.o, attribute)
+
+
+class MFnAttribute(MFnBase):
+
+    def name(self):
+        return self.o.name
+
+    def isHidden(self):
+        return self.o.hidden
+
+    def isDynamic(self):
+        return self.o.dynamic
+
+    def isKeyable(self):
+        return self.o.keyable
+
+
+class MFnNumericAttribute(MFnAttribute):
+
+    def unitType(self):
+        return self.o.data_type
+
+
+class MFnUnitAttribute(MFnAttribute):
+    kInvalid = 0
+    kAngle = 1
+    kDistance = 2
+    kTime = 3
+
+    def unitType(self):
+        return self.o.data_type
+
+
+class MFnTypedAttribute(MFnAttribute):
+
+    def attrType(self):
+        return self.o.data_type
+
+
+class MFnMatrixData(MFnBase):
+    # Plugs of matrix attributes hold an MMatrix as their data.
+
+    def matrix(self):
+        return self.o
+
+
+class MFnMatrixArrayData(MFnBase):
+
+    def array(self):
+        return self.o
+
+
+class MFnCompoundAttribute(MFnAttribute):
+
+    def numChildren(self):
+        return len(self.o.children)
+
+    def child(self, index):
+        return self.o.children[index]
+
+
+def create_numeric_attribute(name, numeric_type=MFnNumericData.kDouble, default=0.0, **kwargs):
+    return Attribute(name, MFn.kNumericAttribute, numeric_type, default, **kwargs)
+
+
+def create_unit_attribute(name, unit_type=MFnUnitAttribute.kDistance, default=0.0, **kwargs):
+    api_types = {MFnUnitAttribute.kAngle: MFn.kDoubleAngleAttribute,
+                 MFnUnitAttribute.kDistance: MFn.kDoubleLinearAttribute,
+                 MFnUnitAttribute.kTime: MFn.kTimeAttribute}
+    return Attribute(name, api_types[unit_type], unit_type, default, fn_types=(MFn.kUnitAttribute,), **kwargs)
+
+
+def create_enum_attribute(name, default=0, **kwargs):
+    return Attribute(name, MFn.kEnumAttribute, None, default, **kwargs)
+
+
+def create_typed_attribute(name, data_type=MFnData.kString, default="", **kwargs):
+    return Attribute(name, MFn.kTypedAttribute, data_type, default, **kwargs)
+
+
+def create_matrix_attribute(name, default=None, **kwargs):
+    return Attribute(name, MFn.kMatrixAttribute, None, default if default is not None else MMatrix(), **kwargs)
+
+
+def create_compound_attribute(name, children, **kwargs):
+    return Attribute(name, MFn.kCompoundAttribute, None, None, children, **kwargs)
+
+
+def create_transform_attributes(extra_attribute_count=0):
+    # Roughly the mix of attribute types found on a transform.
+    attributes = [create_numeric_attribute("visibility", MFnNumericData.kBoolean, True),
+                  create_enum_attribute("nodeState"),
+                  create_typed_attribute("creator")]
+    for name, unit_type in [("translate", MFnUnitAttribute.kDistance), ("rotate", MFnUnitAttribute.kAngle),
+                            ("scale", None), ("shear", None), ("rotatePivot", MFnUnitAttribute.kDistance),
+                            ("scalePivot", MFnUnitAttribute.kDistance)]:
+        if unit_type is None:
+            children = [create_numeric_attribute(name + axis, default=1.0) for axis in "XYZ"]
+        else:
+            children = [create_unit_attribute(name + axis, unit_type) for axis in "XYZ"]
+        attributes.append(create_compound_attribute(name, children))
+    attributes.extend([create_numeric_attribute("attribute%d" % index, [MFnNumericData.kBoolean, MFnNumericData.kInt,
+                                                                        MFnNumericData.kFloat,
+                                                                        MFnNumericData.kDouble][index % 4], 0)
+                       for index in range(extra_attribute_count)])
+    return attributes
+
+
+def create_node(type_name="transform", name=None, attributes=None, api_type=MFn.kTransform):
+    if attributes is None:
+        attributes = create_transform_attributes()
+    return Node(type_name, name or type_name + "1", attributes, api_type)
+
+
+def install():
+    """Register this module as maya.OpenMaya, unless Maya itself can be imported.
+
+    @return True when the stand-in was installed.
+    """
+    try:
+        import maya.OpenMaya
+        return False
+    except ImportError:
+        pass
+
+    maya = types.ModuleType("maya")
+    maya.OpenMaya = sys.modules[__name__]
+    sys.modules["maya"] = maya
+    sys.modules["maya.OpenMaya"] = maya.OpenMaya
+    return True
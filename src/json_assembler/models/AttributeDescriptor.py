@@ -0,0 +1,17 @@
+class AttributeDescriptor(object):
+
+    # What is known about an attribute before any of its plugs is read. Descriptors of static attributes hold for every
+    # node of their node type, so they are shared between nodes.
+
+    def __init__(self, node_type, attribute, name, partial_name, reader, hidden, dynamic, element_reader=None):
+        self.node_type = node_type
+        self.attribute = attribute
+        self.name = name
+        self.partial_name = partial_name
+        self.api_type = attribute.apiType()
+        self.reader = reader
+        self.hidden = hidden
+        self.dynamic = dynamic
+
+        # Readers of array plugs read every element with the reader of their elements.
+        self.element_reader = element_reader
@@ -1,24 +1,135 @@
 import maya.OpenMaya as om
-import sys
+import array
+import functools
+import itertools
+from collections import OrderedDict
 
+from AttributeDescriptor import AttributeDescriptor
 from Entry import Entry
+from EntryKey import EntryKey
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
 
 
 class AttributeEntry(Entry):
 
-    def __init__(self, plug, attribute):
+    # Row and column of every element of a matrix, in row-major order.
+    matrix_elements = [(row, column) for row in range(4) for column in range(4)]
+
+    # Whether matrices are read as flat arrays of 16 elements in row-major order rather than as 4 by 4 arrays.
+    flatten_matrices = False
+
+    # Whether meshes are read as their geometry, with points, normals, topology and UVs, rather than by name.
+    export_geometry = False
+
+    # Largest number of elements read from array plugs, or None to read every element.
+    array_element_limit = None
+
+    # Marks values that have not been read from their plug yet.
+    unread = object()
+
+    # Descriptors of static attributes keyed by node type and attribute name, and the descriptors of every static
+    # attribute of each node type in attribute order. Function sets are then only needed to describe an attribute
+    # once per node type.
+    descriptors = {}
+    node_type_descriptors = {}
+
+    # Readers by attribute type, numeric data type, unit type and typed attribute data type. Each takes a plug and its
+    # attribute and returns the value of the plug.
+    attribute_readers = {
+        om.MFn.kDoubleLinearAttribute: lambda plug, attribute: plug.asDouble(),
+        om.MFn.kEnumAttribute: lambda plug, attribute: plug.asInt(),
+        om.MFn.kMatrixAttribute: lambda plug, attribute: AttributeEntry.get_matrix_value(
+            om.MFnMatrixData(plug.asMObject()).matrix()),
+    }
+
+    numeric_readers = {
+        om.MFnNumericData.kBoolean: lambda plug, attribute: plug.asBool(),
+        om.MFnNumericData.kByte: lambda plug, attribute: plug.asInt(),
+        om.MFnNumericData.kChar: lambda plug, attribute: plug.asChar(),
+        om.MFnNumericData.kShort: lambda plug, attribute: plug.asShort(),
+        om.MFnNumericData.kInt: lambda plug, attribute: plug.asInt(),
+        om.MFnNumericData.kInt64: lambda plug, attribute: plug.asInt64(),
+        om.MFnNumericData.kFloat: lambda plug, attribute: plug.asFloat(),
+        om.MFnNumericData.kDouble: lambda plug, attribute: plug.asDouble(),
+    }
+
+    unit_readers = {
+        om.MFnUnitAttribute.kAngle: lambda plug, attribute: plug.asMAngle().value(),
+        om.MFnUnitAttribute.kDistance: lambda plug, attribute: plug.asMDistance().value(),
+        om.MFnUnitAttribute.kTime: lambda plug, attribute: plug.asMTime().value(),
+    }
+
+    typed_readers = {
+        om.MFnData.kMatrix: lambda plug, attribute: AttributeEntry.get_matrix_value(
+            om.MFnMatrixData(plug.asMObject()).matrix()),
+        om.MFnData.kString: lambda plug, attribute: plug.asString(),
+        om.MFnData.kStringArray: lambda plug, attribute: om.MFnStringArrayData(plug.asMObject()).array(),
+        om.MFnData.kDoubleArray: lambda plug, attribute: AttributeEntry.get_numeric_array_value(
+            'd', om.MFnDoubleArrayData(plug.asMObject()).array()),
+        om.MFnData.kFloatArray: lambda plug, attribute: AttributeEntry.get_numeric_array_value(
+            'f', om.MFnFloatArrayData(plug.asMObject()).array()),
+        om.MFnData.kIntArray: lambda plug, attribute: AttributeEntry.get_numeric_array_value(
+            'i', om.MFnIntArrayData(plug.asMObject()).array()),
+        om.MFnData.kPointArray: lambda plug, attribute: AttributeEntry.get_vector_array_value(
+            om.MFnPointArrayData(plug.asMObject()).array()),
+        om.MFnData.kVectorArray: lambda plug, attribute: AttributeEntry.get_vector_array_value(
+            om.MFnVectorArrayData(plug.asMObject()).array()),
+        om.MFnData.kMatrixArray: lambda plug, attribute: AttributeEntry.get_matrix_array_value(
+            om.MFnMatrixArrayData(plug.asMObject()).array()),
+        om.MFnData.kMesh: lambda plug, attribute: AttributeEntry.get_mesh_value(plug.asMObject()),
+    }
+
+    def __init__(self, plug, attribute, descriptor=None, node_uuid=None):
         self.plug = plug
-        self.attribute_name = self.get_attribute_name()
         self.attribute = attribute
         self.node = plug.node()
-        self.node_uuid = self.get_node_uuid()
+        if node_uuid is None or descriptor is None:
+            # Node entries pass the uuid and descriptor they already hold, so a function set is only needed otherwise.
+            dg_node_fn = om.MFnDependencyNode(self.node)
+            if node_uuid is None:
+                node_uuid = dg_node_fn.uuid().asString()
+            if descriptor is None:
+                descriptor = self.get_descriptor(dg_node_fn.typeName(), plug, attribute)
+        self.node_uuid = node_uuid
+        self.descriptor = descriptor
+        self.attribute_name = descriptor.partial_name
+        self.key = EntryKey(node_uuid, self.attribute_name)
+        self.node_type = descriptor.node_type
+        self.reader = descriptor.reader
         super(AttributeEntry, self).__init__(self.attribute_name)
 
-        try:
-            self.value = self.get_value()
-        except:
+        # Values are read the first time they are used, but readers are resolved straight away so that attributes
+        # which cannot be read are still left out.
+        if self.reader is AttributeEntry.read_unsupported:
             raise AttributeError
-            #self.value = str(sys.exc_info())
+        self.invalidate_value()
+
+    @property
+    def value(self):
+        if self._value is AttributeEntry.unread:
+            try:
+                self._value = self.get_value()
+            except RuntimeError:
+                # The Maya API raises RuntimeError for plugs which cannot be read, such as unconnected message plugs.
+                self._value = None
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def is_value_read(self):
+        return self._value is not AttributeEntry.unread
+
+    def invalidate_value(self):
+        # Files cache the encoded values of their entries, so files holding entries whose values are invalidated,
+        # refreshed or sampled must be told through File.update_entry or File.update_entries.
+        self._value = AttributeEntry.unread
+
+    def refresh_value(self):
+        self.invalidate_value()
+        return self.value
 
     def get_icon_path(self):
         return ":default.svg"
@@ -33,6 +144,10 @@ class AttributeEntry(Entry):
         dg_node_fn = om.MFnDependencyNode(self.node)
         return dg_node_fn.uuid().asString()
 
+    def get_node_type(self):
+        dg_node_fn = om.MFnDependencyNode(self.node)
+        return dg_node_fn.typeName()
+
     def is_non_keyable(self):
         return not self.plug.isKeyable()
 
@@ -40,135 +155,314 @@ class AttributeEntry(Entry):
         return self.plug.isConnected()
 
     def is_hidden(self):
-        attribute_fn = om.MFnAttribute(self.attribute)
-        return attribute_fn.isHidden()
+        return self.descriptor.hidden
 
     def get_value(self):
-        return self.get_attribute_value(self.plug, self.attribute)
+        return self.reader(self.plug, self.attribute)
+
+    def sample_value(self, frames):
+        return self.get_samples([self], frames)[0]
+
+    def is_array_attribute(self):
+        return self.descriptor.element_reader is not None
+
+    def get_elements(self, start=None, stop=None):
+        # Read a slice of the elements of an array plug, counted in existing elements rather than logical indices.
+        if not self.is_array_attribute():
+            raise TypeError(self.attribute_name + " is not an array attribute")
+        return self.get_array_value(self.plug, self.attribute, self.descriptor.element_reader, start, stop)
+
+    @classmethod
+    def get_samples(cls, entries, frames):
+        # Every entry is read at a frame before moving on to the next frame, so that the evaluation context is only
+        # made current once per frame. The samples of each entry are packed into a typed array where possible, and
+        # samples that cannot be read are None.
+        samples = [[] for _ in entries]
+        readers = [(entry.reader, entry.plug, entry.attribute, entry_samples)
+                   for entry, entry_samples in zip(entries, samples)]
+        for frame in frames:
+            previous_context = cls.get_frame_context(frame).makeCurrent()
+            try:
+                for reader, plug, attribute, entry_samples in readers:
+                    try:
+                        entry_samples.append(reader(plug, attribute))
+                    except RuntimeError:
+                        entry_samples.append(None)
+            finally:
+                previous_context.makeCurrent()
+        return [TypedArray.pack(x) for x in samples]
+
+    @classmethod
+    def sample(cls, entries, frames):
+        # Replace the values of the entries by their samples, which are kept until the values are refreshed. Files
+        # holding the entries must be told through File.update_entries.
+        for entry, entry_samples in zip(entries, cls.get_samples(entries, frames)):
+            entry.value = entry_samples
 
     @staticmethod
-    def get_attribute_value(plug, attribute):
-        plug_type = attribute.apiTypeStr()
+    def get_frame_context(frame):
+        return om.MDGContext(om.MTime(frame, om.MTime.uiUnit()))
+
+    @classmethod
+    def create_descriptor(cls, node_type, plug, attribute):
+        attribute_fn = om.MFnAttribute(attribute)
+        try:
+            element_reader = cls.resolve_element_reader(plug, attribute)
+        except RuntimeError:
+            element_reader = cls.read_unsupported
+        if plug.isArray():
+            reader = cls.get_array_reader(element_reader)
+        else:
+            reader = element_reader
+            element_reader = None
+        return AttributeDescriptor(node_type, attribute, attribute_fn.name(),
+                                   plug.partialName(False, False, False, False, False, True), reader,
+                                   attribute_fn.isHidden(), attribute_fn.isDynamic(), element_reader)
+
+    @classmethod
+    def get_descriptor(cls, node_type, plug, attribute):
+        key = (node_type, plug.partialName(False, False, False, False, False, True))
+        descriptor = cls.descriptors.get(key)
+        if descriptor is None:
+            descriptor = cls.create_descriptor(node_type, plug, attribute)
+            # Dynamic attributes of the same name may differ from one node to the next.
+            if not descriptor.dynamic:
+                cls.descriptors[key] = descriptor
+        return descriptor
+
+    @classmethod
+    def get_node_descriptors(cls, depend_fn):
+        # Dynamic attributes follow the static attributes of a node, and are described anew for every node so that
+        # attributes added since are picked up.
+        node_type = depend_fn.typeName()
+        attribute_count = depend_fn.attributeCount()
+        static_descriptors = cls.node_type_descriptors.get(node_type)
+        if static_descriptors is None or len(static_descriptors) > attribute_count:
+            static_descriptors = []
+            for attribute_index in range(attribute_count):
+                attribute = depend_fn.attribute(attribute_index)
+                descriptor = cls.get_descriptor(node_type, depend_fn.findPlug(attribute, True), attribute)
+                if descriptor.dynamic:
+                    break
+                static_descriptors.append(descriptor)
+            cls.node_type_descriptors[node_type] = static_descriptors
 
-        # attribute_fn = om.MFnAttribute(attribute)
-        # print(attribute_fn.name() + " has a plug type of " + plug_type + ".")
+        descriptors = list(static_descriptors)
+        for attribute_index in range(len(static_descriptors), attribute_count):
+            attribute = depend_fn.attribute(attribute_index)
+            descriptors.append(cls.get_descriptor(node_type, depend_fn.findPlug(attribute, True), attribute))
+        return descriptors
 
+    @classmethod
+    def invalidate_node_type(cls, node_type):
+        # Needed when the definition of a node type changes, such as when the plug-in defining it is reloaded.
+        cls.node_type_descriptors.pop(node_type, None)
+        for key in [x for x in cls.descriptors if x[0] == node_type]:
+            del cls.descriptors[key]
+
+    @classmethod
+    def clear_descriptors(cls):
+        cls.descriptors.clear()
+        cls.node_type_descriptors.clear()
+
+    @classmethod
+    def resolve_reader(cls, plug, attribute):
+        element_reader = cls.resolve_element_reader(plug, attribute)
+        return cls.get_array_reader(element_reader) if plug.isArray() else element_reader
+
+    @classmethod
+    def get_array_reader(cls, element_reader):
+        if element_reader is cls.read_unsupported:
+            return element_reader
+        return functools.partial(cls.read_array, element_reader)
+
+    @classmethod
+    def resolve_element_reader(cls, plug, attribute):
         if attribute.hasFn(om.MFn.kCompoundAttribute) or plug.isCompound():
-            return AttributeEntry.get_compound_attribute_value(plug, attribute)
+            return cls.get_compound_reader(plug, attribute)
         elif attribute.hasFn(om.MFn.kUnitAttribute):
-            return AttributeEntry.get_unit_attribute_value(plug, attribute)
-        elif plug_type == "kNumericAttribute":
-            return AttributeEntry.get_numeric_attribute_value(plug, attribute)
-        elif plug_type == "kDoubleLinearAttribute":
-            return plug.asDouble()
-        elif plug_type == "kEnumAttribute":
-            return plug.asInt()
-        elif plug_type == "kTypedAttribute":
-            return AttributeEntry.get_typed_attribute_value(plug, attribute)
-        elif plug_type == "kGenericAttribute":
-            raise NotImplementedError
+            unit_type = om.MFnUnitAttribute(attribute).unitType()
+            return cls.unit_readers.get(unit_type, cls.read_unsupported)
+
+        attribute_type = attribute.apiType()
+        if attribute_type == om.MFn.kNumericAttribute:
+            return cls.resolve_numeric_reader(attribute)
+        elif attribute_type == om.MFn.kTypedAttribute:
+            data_type = om.MFnTypedAttribute(attribute).attrType()
+            if data_type == om.MFnData.kNumeric:
+                return cls.resolve_numeric_reader(attribute)
+            return cls.typed_readers.get(data_type, cls.read_unsupported)
         else:
-            raise NotImplementedError
-
-    @staticmethod
-    def get_numeric_attribute_value(plug, attribute):
-        numeric_fn = om.MFnNumericAttribute(attribute)
-        unit_type = numeric_fn.unitType()
-        # print(numeric_fn.name() + "\'s numeric attribute has found a unit type of " + str(unit_type) + ".")
-
-        if unit_type == om.MFnNumericData.kBoolean:
-            return plug.asBool()
-        elif unit_type == om.MFnNumericData.kByte:
-            return plug.asInt()
-        elif unit_type == om.MFnNumericData.kChar:
-            return plug.asChar()
-        elif unit_type == om.MFnNumericData.kShort:
-            return plug.asShort()  # Produces an error.
-        elif unit_type == om.MFnNumericData.kLong:
-            return plug.asDouble()
-        elif unit_type == om.MFnNumericData.kInt:
-            return plug.asInt()
-        elif unit_type == om.MFnNumericData.kInt64:
-            return plug.asInt64()
-        elif unit_type == om.MFnNumericData.kFloat:
-            return plug.asFloat()
-        elif unit_type == om.MFnNumericData.kDouble:
-            return plug.asDouble()
+            return cls.attribute_readers.get(attribute_type, cls.read_unsupported)
 
-    @staticmethod
-    def get_compound_attribute_value(plug, attribute):
+    @classmethod
+    def get_compound_reader(cls, plug, attribute):
+        # The readers of the children are resolved along with the reader of the compound, so that reading it only
+        # walks the child plugs. Children which cannot be read are left out, as they are from nodes.
         compound_fn = om.MFnCompoundAttribute(attribute)
-        value = {}
+        children = []
         for child_index in range(compound_fn.numChildren()):
             child_attribute = compound_fn.child(child_index)
-            child_node = plug.node()
-            child_plug = om.MPlug(child_node, child_attribute)
-            child_attribute = AttributeEntry(child_plug, child_attribute)
-            child_attribute_name = child_attribute.attribute_name
-            child_attribute_value = child_attribute.get_value()
-            value[child_attribute_name] = child_attribute_value
-        return value
+            try:
+                child_reader = cls.resolve_reader(om.MPlug(plug.node(), child_attribute), child_attribute)
+            except RuntimeError:
+                continue
+            if child_reader is not cls.read_unsupported:
+                children.append((child_index, om.MFnAttribute(child_attribute).name(), child_attribute, child_reader))
+        return functools.partial(cls.read_compound, tuple(children))
+
+    @classmethod
+    def resolve_numeric_reader(cls, attribute):
+        unit_type = om.MFnNumericAttribute(attribute).unitType()
+        return cls.numeric_readers.get(unit_type, cls.read_nothing)
 
     @staticmethod
-    def get_typed_attribute_value(plug, attribute):
-        typed_fn = om.MFnTypedAttribute(attribute)
-        attribute_type = typed_fn.attrType()
-        # print(typed_fn.name() + "\'s typed attribute has found a type of " + str(attribute_type) + ".")
-
-        if attribute_type == om.MFnData.kNumeric:
-            return AttributeEntry.get_numeric_attribute_value(plug, attribute)
-        elif attribute_type == om.MFnData.kMatrix:
-            matrix = om.MFnMatrixData(plug.asMObject()).matrix()
-            matrix_multi_array = [[[] for i in range(4)] for i in range(4)]
-            for x in range(4):
-                for y in range(4):
-                    matrix_multi_array[x][y] = matrix(x, y)
-            return matrix_multi_array
-        elif attribute_type == om.MFnData.kString:
-            return plug.asString()
-        elif attribute_type == om.MFnData.kStringArray:
-            return om.MFnStringArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kDoubleArray:
-            return om.MFnDoubleArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kFloatArray:
-            return om.MFnFloatArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kIntArray:
-            return om.MFnIntArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kPointArray:
-            return om.MFnPointArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kVectorArray:
-            return om.MFnVectorArrayData(plug.asMObject()).array()
-        elif attribute_type == om.MFnData.kMatrixArray:
-            matrix_array = om.MFnMatrixArrayData(plug.asMObject()).array()
-            return [AttributeEntry.get_typed_attribute_value(plug, attribute) for m in matrix_array]
-        elif attribute_type == om.MFnData.kComponentList:
-            raise NotImplementedError
-        elif attribute_type == om.MFnData.kMesh:
-            mesh = om.MFnMeshData(plug.asMObject()).create()
-            return om.MFnDependencyNode(mesh).name()
-        elif attribute_type == om.MFnData.kLattice:
-            raise NotImplementedError
-        else:
-            raise NotImplementedError
+    def read_array(element_reader, plug, attribute):
+        return AttributeEntry.get_array_value(plug, attribute, element_reader, 0, AttributeEntry.array_element_limit)
+
+    @staticmethod
+    def read_unsupported(plug, attribute):
+        raise NotImplementedError
+
+    @staticmethod
+    def read_nothing(plug, attribute):
+        return None
 
     @staticmethod
-    def get_unit_attribute_value(plug, attribute):
-        unit_fn = om.MFnUnitAttribute(attribute)
-        unit_type = unit_fn.unitType()
-        # print(unit_fn.name() + "\'s unit attribute has found a type of " + str(unit_type) + ".")
+    def get_attribute_value(plug, attribute):
+        return AttributeEntry.resolve_reader(plug, attribute)(plug, attribute)
 
-        if unit_type == om.MFnUnitAttribute.kAngle:
-            return plug.asMAngle().value()
-        elif unit_type == om.MFnUnitAttribute.kDistance:
-            return plug.asMDistance().value()
-        elif unit_type == om.MFnUnitAttribute.kTime:
-            return plug.asMTime().value()
+    @staticmethod
+    def get_array_value(plug, attribute, element_reader, start=None, stop=None):
+        # The logical indices in use are fetched at once, and only the elements from start to stop are read. Values of
+        # arrays with gaps in their indices are given along with the indices.
+        indices = om.MIntArray()
+        plug.getExistingArrayAttributeIndices(indices)
+        start, stop, _ = slice(start, stop).indices(indices.length())
+        logical_indices = [indices[index] for index in range(start, stop)]
+        if logical_indices:
+            values = TypedArray.pack([element_reader(plug.elementByLogicalIndex(index), attribute)
+                                      for index in logical_indices])
         else:
-            raise NotImplementedError
+            values = AttributeEntry.get_empty_array_value(plug, attribute, element_reader, indices)
+        if logical_indices == list(range(start, stop)):
+            return values
+        return OrderedDict([("indices", TypedArray('i', logical_indices)), ("values", values)])
+
+    @staticmethod
+    def get_empty_array_value(plug, attribute, element_reader, indices):
+        # Empty slices take their type and element shape from the first element, so that they are packed like any
+        # other slice. Arrays without elements have no element shape and are left as lists.
+        if indices.length():
+            first = TypedArray.pack([element_reader(plug.elementByLogicalIndex(indices[0]), attribute)])
+            if isinstance(first, TypedArray):
+                return TypedArray(first.typecode, (), (0,) + first.shape[1:])
+        return []
+
+    @staticmethod
+    def get_compound_attribute_value(plug, attribute):
+        return AttributeEntry.get_compound_reader(plug, attribute)(plug, attribute)
+
+    @staticmethod
+    def read_compound(children, plug, attribute):
+        # Child plugs are reached through their parent plug, so element plugs of arrays of compounds read their own
+        # children.
+        value = OrderedDict()
+        for child_index, child_name, child_attribute, child_reader in children:
+            try:
+                value[child_name] = child_reader(plug.child(child_index), child_attribute)
+            except RuntimeError:
+                value[child_name] = None
+        return value
+
+    @staticmethod
+    def get_matrix_shape():
+        return (16,) if AttributeEntry.flatten_matrices else (4, 4)
+
+    @staticmethod
+    def get_matrix_value(matrix):
+        # starmap calls the matrix for every element without going through Python bytecode between calls.
+        values = array.array('d')
+        values.extend(itertools.starmap(matrix, AttributeEntry.matrix_elements))
+        return TypedArray('d', values, AttributeEntry.get_matrix_shape())
+
+    @staticmethod
+    def get_matrix_array_value(matrices):
+        # The elements of every matrix are gathered into a single buffer, shaped with the number of matrices first.
+        values = array.array('d')
+        matrix_elements = AttributeEntry.matrix_elements
+        for index in range(matrices.length()):
+            values.extend(itertools.starmap(matrices[index], matrix_elements))
+        return TypedArray('d', values, (matrices.length(),) + AttributeEntry.get_matrix_shape())
+
+    @staticmethod
+    def get_numeric_array_value(typecode, values):
+        return TypedArray(typecode, (values[index] for index in range(values.length())))
+
+    @staticmethod
+    def get_vector_array_value(vectors, typecode='d'):
+        # Points and vectors are stored as rows of x, y and z, leaving out the w of points.
+        values = array.array(typecode)
+        for index in range(vectors.length()):
+            vector = vectors[index]
+            values.extend((vector.x, vector.y, vector.z))
+        return TypedArray(typecode, values, (vectors.length(), 3))
+
+    @staticmethod
+    def get_mesh_value(mesh_data):
+        if AttributeEntry.export_geometry:
+            return AttributeEntry.get_mesh_geometry(mesh_data)
+        return om.MFnDependencyNode(om.MFnMeshData(mesh_data).create()).name()
+
+    @staticmethod
+    def get_mesh_geometry(mesh_data):
+        # Components are read from the mesh data when they are encoded. The data is a copy held by the plug's value,
+        # so the geometry is that of the plug when it was read. Faces without UVs have a UV count of 0, which is why
+        # UV counts are given along with the face vertex counts.
+        read_indices = AttributeEntry.read_mesh_indices
+        return MeshGeometry([
+            ("points", functools.partial(AttributeEntry.read_mesh_points, mesh_data)),
+            ("faceVertexCounts", functools.partial(read_indices, mesh_data, "getVertices", 0)),
+            ("faceVertexIndices", functools.partial(read_indices, mesh_data, "getVertices", 1)),
+            ("normals", functools.partial(AttributeEntry.read_mesh_normals, mesh_data)),
+            ("normalIndices", functools.partial(read_indices, mesh_data, "getNormalIds", 1)),
+            ("uvs", functools.partial(AttributeEntry.read_mesh_uvs, mesh_data)),
+            ("uvCounts", functools.partial(read_indices, mesh_data, "getAssignedUVs", 0)),
+            ("uvIndices", functools.partial(read_indices, mesh_data, "getAssignedUVs", 1)),
+        ])
+
+    @staticmethod
+    def read_mesh_points(mesh_data):
+        points = om.MFloatPointArray()
+        om.MFnMesh(mesh_data).getPoints(points)
+        return AttributeEntry.get_vector_array_value(points, 'f')
+
+    @staticmethod
+    def read_mesh_normals(mesh_data):
+        normals = om.MFloatVectorArray()
+        om.MFnMesh(mesh_data).getNormals(normals)
+        return AttributeEntry.get_vector_array_value(normals, 'f')
+
+    @staticmethod
+    def read_mesh_uvs(mesh_data):
+        u_values = om.MFloatArray()
+        v_values = om.MFloatArray()
+        om.MFnMesh(mesh_data).getUVs(u_values, v_values)
+        values = array.array('f')
+        for index in range(u_values.length()):
+            values.extend((u_values[index], v_values[index]))
+        return TypedArray('f', values, (u_values.length(), 2))
+
+    @staticmethod
+    def read_mesh_indices(mesh_data, method_name, array_index):
+        # The topology getters of MFnMesh fill a pair of arrays, of counts per face and of indices.
+        index_arrays = (om.MIntArray(), om.MIntArray())
+        getattr(om.MFnMesh(mesh_data), method_name)(*index_arrays)
+        return AttributeEntry.get_numeric_array_value('i', index_arrays[array_index])
 
     def __eq__(self, other):
         if self.__class__ == other.__class__:
-            return self.attribute == other.attribute
+            return self.key == other.key
         else:
             return False
 
@@ -176,4 +470,4 @@ class AttributeEntry(Entry):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.node_uuid) + hash(self.attribute_name)
+        return hash(self.key)
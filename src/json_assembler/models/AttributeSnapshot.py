@@ -0,0 +1,29 @@
+from collections import OrderedDict
+
+from TypedArray import TypedArray
+
+
+class AttributeSnapshot(object):
+
+    # Attribute values of many nodes held column by column, each column holding the values of one attribute in node
+    # order. Columns of numbers, or of typed arrays sharing a shape, are packed into a single typed array.
+
+    def __init__(self, node_names=(), node_uuids=(), columns=None):
+        self.node_names = list(node_names)
+        self.node_uuids = list(node_uuids)
+        self.columns = OrderedDict()
+        if columns is not None:
+            for name, values in columns.items():
+                self.columns[name] = TypedArray.pack(values)
+
+    def get_column(self, name):
+        return self.columns[name]
+
+    def get_row(self, index):
+        return OrderedDict([(name, column[index]) for name, column in self.columns.items()])
+
+    def as_dict(self):
+        return OrderedDict([("nodes", self.node_names), ("uuids", self.node_uuids), ("attributes", self.columns)])
+
+    def __len__(self):
+        return len(self.node_names)
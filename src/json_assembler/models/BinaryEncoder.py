@@ -0,0 +1,172 @@
+import array
+import sys
+import types
+
+from AttributeSnapshot import AttributeSnapshot
+from Entry import Entry
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
+
+try:
+    text_type = unicode
+    integer_types = (int, long)
+except NameError:
+    text_type = str
+    integer_types = (int,)
+
+
+class BinaryEncoder(object):
+
+    # Base class for encoders writing entries to a binary format, where subclasses provide the encoding of each type.
+    # Typed arrays and numeric array.array values are written as packed little-endian buffers rather than as arrays
+    # of individually encoded numbers. Plain lists are always written as arrays, so their values keep their types.
+
+    # Number of bytes gathered before a chunk is yielded by iterencode.
+    chunk_size = 65536
+
+    # Array type codes by signedness and item size, normalized so that the codes are the same on every platform.
+    integer_typecodes = {(True, 1): 'b', (False, 1): 'B', (True, 2): 'h', (False, 2): 'H',
+                         (True, 4): 'i', (False, 4): 'I', (True, 8): 'q', (False, 8): 'Q'}
+    float_typecodes = {4: 'f', 8: 'd'}
+
+    def encode_nil(self):
+        raise NotImplementedError
+
+    def encode_bool(self, o):
+        raise NotImplementedError
+
+    def encode_int(self, o):
+        raise NotImplementedError
+
+    def encode_float(self, o):
+        raise NotImplementedError
+
+    def encode_text(self, o):
+        raise NotImplementedError
+
+    def encode_array_header(self, length):
+        raise NotImplementedError
+
+    def encode_map_header(self, length):
+        raise NotImplementedError
+
+    def encode_typed_array(self, typecode, shape, data):
+        raise NotImplementedError
+
+    def get_typed_array(self, o):
+        # Return the normalized type code, shape and little-endian buffer of typed arrays, or None.
+        if isinstance(o, TypedArray):
+            data = o.data
+            shape = o.shape
+        elif isinstance(o, array.array):
+            data = o
+            shape = (len(o),)
+        else:
+            return None
+
+        if data.typecode in 'fd':
+            typecode = self.float_typecodes[data.itemsize]
+        elif data.typecode in 'bhilq':
+            typecode = self.integer_typecodes[(True, data.itemsize)]
+        elif data.typecode in 'BHILQ':
+            typecode = self.integer_typecodes[(False, data.itemsize)]
+        else:
+            return None
+
+        if sys.byteorder == 'big' and data.itemsize > 1:
+            data = array.array(data.typecode, data)
+            data.byteswap()
+        buffer = data.tobytes() if hasattr(data, 'tobytes') else data.tostring()
+        return typecode, shape, buffer
+
+    def encode_scalar(self, o):
+        if o is None:
+            return self.encode_nil()
+        elif isinstance(o, bool):
+            return self.encode_bool(o)
+        elif isinstance(o, float):
+            return self.encode_float(o)
+        elif isinstance(o, Entry):
+            return self.encode_text(o.title)
+        elif isinstance(o, (bytes, text_type)):
+            return self.encode_text(o)
+        elif isinstance(o, integer_types):
+            return self.encode_int(o)
+        else:
+            raise TypeError(repr(o) + " cannot be encoded")
+
+    def iterencode_dict(self, o):
+        yield self.encode_map_header(len(o))
+        for key, value in o.items():
+            yield self.encode_scalar(key)
+            yield self.encode_fragment(value)
+
+    def iterencode_list(self, o):
+        yield self.encode_array_header(len(o))
+        for item in o:
+            yield self.encode_fragment(item)
+
+    def iterencode_nodes(self, nodes):
+        # Encode (entry, child nodes) pairs as a map keyed by title.
+        yield self.encode_map_header(len(nodes))
+        for node in nodes:
+            yield self.encode_text(node[0].title)
+            yield self.encode_node(node)
+
+    def iterencode_node_list(self, nodes):
+        # Children of arrays are wrapped in maps of their own, as in EntryEncoder.iterencode_node_list.
+        yield self.encode_array_header(len(nodes))
+        for node in nodes:
+            yield self.iterencode_nodes([node])
+
+    def encode_node(self, node):
+        entry, child_nodes = node
+        if not child_nodes:
+            return self.encode_fragment(entry.value)
+        elif isinstance(entry.value, list):
+            return self.iterencode_node_list(child_nodes)
+        else:
+            return self.iterencode_nodes(child_nodes)
+
+    def encode_fragment(self, o):
+        # Scalars and typed arrays are encoded straight away, while containers and meshes are returned as generators.
+        typed_array = self.get_typed_array(o)
+        if typed_array is not None:
+            return self.encode_typed_array(*typed_array)
+        elif isinstance(o, dict):
+            return self.iterencode_dict(o)
+        elif isinstance(o, AttributeSnapshot):
+            return self.iterencode_dict(o.as_dict())
+        elif isinstance(o, MeshGeometry):
+            return self.iterencode_dict(o)
+        elif isinstance(o, (list, tuple)):
+            return self.iterencode_list(o)
+        else:
+            return self.encode_scalar(o)
+
+    def iterencode_fragments(self, fragments):
+        chunk = bytearray()
+        stack = [fragments]
+        while stack:
+            for fragment in stack[-1]:
+                if isinstance(fragment, types.GeneratorType):
+                    stack.append(fragment)
+                    break
+                chunk.extend(fragment)
+                if len(chunk) >= self.chunk_size:
+                    yield bytes(chunk)
+                    chunk = bytearray()
+            else:
+                stack.pop()
+
+        if chunk:
+            yield bytes(chunk)
+
+    def iterencode(self, o):
+        return self.iterencode_fragments(iter([self.encode_fragment(o)]))
+
+    def iterencode_tree(self, nodes):
+        return self.iterencode_fragments(self.iterencode_nodes(nodes))
+
+    def encode(self, o):
+        return b"".join(self.iterencode(o))
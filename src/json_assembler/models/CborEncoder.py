@@ -0,0 +1,60 @@
+import struct
+
+from BinaryEncoder import BinaryEncoder, text_type
+
+
+class CborEncoder(BinaryEncoder):
+
+    # Typed array tags from RFC 8746 by normalized array type code, all little-endian. Arrays of higher dimensions are
+    # wrapped in the row-major multi-dimensional array tag.
+    typed_array_tags = {'B': 64, 'H': 69, 'I': 70, 'Q': 71, 'b': 72, 'h': 77, 'i': 78, 'q': 79, 'f': 85, 'd': 86}
+    multi_dimensional_array_tag = 40
+
+    def encode_head(self, major_type, value):
+        major_type <<= 5
+        if value < 24:
+            return struct.pack(">B", major_type | value)
+        elif value <= 0xff:
+            return struct.pack(">BB", major_type | 24, value)
+        elif value <= 0xffff:
+            return struct.pack(">BH", major_type | 25, value)
+        elif value <= 0xffffffff:
+            return struct.pack(">BI", major_type | 26, value)
+        elif value <= 0xffffffffffffffff:
+            return struct.pack(">BQ", major_type | 27, value)
+        else:
+            raise OverflowError(repr(value) + " is out of range for CBOR")
+
+    def encode_nil(self):
+        return b"\xf6"
+
+    def encode_bool(self, o):
+        return b"\xf5" if o else b"\xf4"
+
+    def encode_int(self, o):
+        if o >= 0:
+            return self.encode_head(0, o)
+        else:
+            return self.encode_head(1, -1 - o)
+
+    def encode_float(self, o):
+        return struct.pack(">Bd", 0xfb, o)
+
+    def encode_text(self, o):
+        if isinstance(o, text_type):
+            o = o.encode("utf-8")
+        return self.encode_head(3, len(o)) + o
+
+    def encode_array_header(self, length):
+        return self.encode_head(4, length)
+
+    def encode_map_header(self, length):
+        return self.encode_head(5, length)
+
+    def encode_typed_array(self, typecode, shape, data):
+        typed_array = self.encode_head(6, self.typed_array_tags[typecode]) + self.encode_head(2, len(data)) + data
+        if len(shape) == 1:
+            return typed_array
+        dimensions = self.encode_array_header(len(shape)) + b"".join([self.encode_int(x) for x in shape])
+        return (self.encode_head(6, self.multi_dimensional_array_tag) + self.encode_array_header(2) + dimensions +
+                typed_array)
@@ -1,14 +1,22 @@
 from datetime import datetime
+import itertools
+
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
 
 
 class Entry(object):
 
+    # Entries created within the same clock tick share a creation time, so a serial number tells them apart.
+    serial_numbers = itertools.count()
+
     def __init__(self, title="New Entry"):
         self.title = title
         self.parent = None
         self.position = 0
         self.value = None
         self.created_at = datetime.now()
+        self.serial_number = next(Entry.serial_numbers)
 
     def get_icon_path(self):
         return ":fileNew.png"
@@ -26,12 +34,12 @@ class Entry(object):
         return False
 
     def is_object(self):
-        if isinstance(self.value, dict):
+        if isinstance(self.value, (dict, MeshGeometry)):
             return True
         return False
 
     def is_array(self):
-        if isinstance(self.value, list):
+        if isinstance(self.value, (list, TypedArray)):
             return True
         return False
 
@@ -42,7 +50,7 @@ class Entry(object):
 
     def __eq__(self, other):
         if self.__class__ == other.__class__:
-            return self.created_at == self.created_at
+            return (self.created_at, self.serial_number) == (other.created_at, other.serial_number)
         else:
             return False
 
@@ -50,4 +58,4 @@ class Entry(object):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.created_at)
+        return hash((self.created_at, self.serial_number))
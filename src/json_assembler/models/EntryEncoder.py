@@ -1,66 +1,299 @@
 import json
+import types
 
+from AttributeSnapshot import AttributeSnapshot
 from Entry import Entry
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
 
 
 class EntryEncoder(json.JSONEncoder):
 
+    # Number of encoded fragments joined together before a chunk is yielded by iterencode.
+    chunk_size = 4096
+
+    def __init__(self, *args, **kwargs):
+        super(EntryEncoder, self).__init__(*args, **kwargs)
+
+        # Leaf counts of the containers being encoded, keyed by container id.
+        self.leaf_counts = {}
+
+    def count_leaves(self, o):
+        # Count the leaves of every container in a single bottom-up pass.
+        leaf_counts = {}
+        stack = [(o, False)]
+        while stack:
+            container, visited = stack.pop()
+            values = container.values() if isinstance(container, dict) else container
+            if visited:
+                leaf_counts[id(container)] = sum([leaf_counts[id(value)] if isinstance(value, (dict, list))
+                                                  else self.get_leaf_count(value) for value in values])
+            else:
+                stack.append((container, True))
+                stack.extend([(value, False) for value in values if isinstance(value, (dict, list))])
+        return leaf_counts
+
+    def count_tree_leaves(self, nodes):
+        # Count the leaves below every (entry, child nodes) pair that has children, visiting children first.
+        ordered_nodes = []
+        stack = [x for x in nodes if x[1]]
+        while stack:
+            node = stack.pop()
+            ordered_nodes.append(node)
+            stack.extend([x for x in node[1] if x[1]])
+
+        self.leaf_counts = {}
+        for node in reversed(ordered_nodes):
+            self.leaf_counts[id(node)] = sum([self.get_node_count(x) for x in node[1]])
+        self.leaf_counts[id(nodes)] = sum([self.get_node_count(x) for x in nodes])
+        return self.leaf_counts
+
+    def get_node_count(self, node):
+        entry, child_nodes = node
+        if not self.indent:
+            return 0
+        elif child_nodes:
+            return self.leaf_counts.get(id(node), 0)
+        elif isinstance(entry.value, (dict, list)):
+            if id(entry.value) not in self.leaf_counts:
+                self.leaf_counts.update(self.count_leaves(entry.value))
+            return self.leaf_counts[id(entry.value)]
+        else:
+            return self.get_leaf_count(entry.value)
+
+    def get_leaf_count(self, o):
+        # Typed arrays and snapshots hold as many leaves as the lists and dictionaries they stand for. Meshes are
+        # counted by component, as reading their components only to count them would defeat reading them lazily.
+        if isinstance(o, TypedArray):
+            return o.size
+        elif isinstance(o, AttributeSnapshot):
+            return self.get_count(o.as_dict())
+        elif isinstance(o, MeshGeometry):
+            return len(o)
+        else:
+            return 1
+
     def get_count(self, o):
-        if isinstance(o, list):
+        if id(o) in self.leaf_counts:
+            return self.leaf_counts[id(o)]
+        elif isinstance(o, list):
             return sum([self.get_count(item) for item in o])
         elif isinstance(o, dict):
             return sum([self.get_count(item) for item in o.values()])
         else:
-            return 1
+            return self.get_leaf_count(o)
 
     def get_indent_size(self, o):
+        if not self.indent:
+            return 0
         count = self.get_count(o)
         if count > 1:
             return self.indent
         else:
             return 0
 
-    def add_indentation(self, string, size, depth):
+    def get_indentation(self, size, depth):
         if size:
-            return string + "\n" + ((depth * size) * " ")
+            return "\n" + ((depth * size) * " ")
         else:
-            return string
+            return ""
 
-    def encode_dict(self, o, depth=0):
-        string = "{"
+    def iterencode_dict(self, o, depth=0):
+        yield "{"
         indent_size = self.get_indent_size(o)
+        inner_depth = depth + 1
+        inner_indentation = self.get_indentation(indent_size, inner_depth)
         for count, (key, value) in enumerate(o.items()):
-            inner_depth = depth + 1
-            string = self.add_indentation(string, indent_size, inner_depth)
-            encoded_key = super(EntryEncoder, self).encode(key)
-            encoded_value = self.encode(value, inner_depth)
-            string = string + "%s: %s" % (encoded_key, encoded_value)
-            if count < len(o) - 1:
-                string = string + ", "
-        string = self.add_indentation(string, indent_size, depth)
-        string = string + "}"
-        return string
-
-    def encode_list(self, o, depth=0):
-        string = "["
+            if count > 0:
+                yield ", "
+            yield inner_indentation
+            yield self.encode_value(key)
+            yield ": "
+            yield self.encode_fragment(value, inner_depth)
+        yield self.get_indentation(indent_size, depth)
+        yield "}"
+
+    def iterencode_list(self, o, depth=0):
+        yield "["
         indent_size = self.get_indent_size(o)
+        inner_depth = depth + 1
+        inner_indentation = self.get_indentation(indent_size, inner_depth)
         for count, item in enumerate(o):
-            inner_depth = depth + 1
-            string = self.add_indentation(string, indent_size, inner_depth)
-            string = string + self.encode(item, inner_depth)
-            if count < len(o) - 1:
-                string = string + ", "
-        string = self.add_indentation(string, indent_size, depth)
-        string = string + "]"
-        return string
-
-    def encode(self, o, depth=0):
+            if count > 0:
+                yield ", "
+            yield inner_indentation
+            yield self.encode_fragment(item, inner_depth)
+        yield self.get_indentation(indent_size, depth)
+        yield "]"
+
+    def iterencode_container(self, o, depth=0):
         if isinstance(o, dict):
-            return self.encode_dict(o, depth)
-        elif isinstance(o, list):
-            return self.encode_list(o, depth)
+            return self.iterencode_dict(o, depth)
+        else:
+            return self.iterencode_list(o, depth)
+
+    def iterencode_typed_array(self, o, depth=0):
+        # Numbers are formatted a run at a time, laid out the way iterencode_list lays out the equivalent lists.
+        yield "["
+        indent_size = self.indent if self.indent and o.size > 1 else 0
+        inner_depth = depth + 1
+        inner_indentation = self.get_indentation(indent_size, inner_depth)
+        separator = ", " + inner_indentation
+        if len(o.shape) == 1:
+            for start in range(0, o.size, self.chunk_size):
+                yield separator if start > 0 else inner_indentation
+                yield self.format_numbers(o, start, min(start + self.chunk_size, o.size), separator)
         else:
-            return super(EntryEncoder, self).encode(o)
+            # Every element of the first dimension is laid out alike, so a single format string lays out a whole run.
+            block_shape = o.shape[1:]
+            block_size = o.get_shape_size(block_shape)
+            blocks_per_chunk = max(1, self.chunk_size // max(block_size, 1))
+            for block in range(0, o.shape[0], blocks_per_chunk):
+                yield separator if block > 0 else inner_indentation
+                yield self.format_blocks(o, block * block_size, min(blocks_per_chunk, o.shape[0] - block),
+                                         block_shape, inner_depth, separator)
+        yield self.get_indentation(indent_size, depth)
+        yield "]"
+
+    def get_block_format(self, shape, depth, conversion):
+        indent_size = self.indent if self.indent and TypedArray.get_shape_size(shape) > 1 else 0
+        inner_indentation = self.get_indentation(indent_size, depth + 1)
+        if len(shape) == 1:
+            items = [conversion] * shape[0]
+        else:
+            items = [self.get_block_format(shape[1:], depth + 1, conversion)] * shape[0]
+        return "".join(["[", inner_indentation, (", " + inner_indentation).join(items),
+                        self.get_indentation(indent_size, depth), "]"])
+
+    def format_blocks(self, o, start, block_count, block_shape, depth, separator):
+        values = tuple(o.data[start:start + block_count * o.get_shape_size(block_shape)])
+        if not o.is_float():
+            return separator.join([self.get_block_format(block_shape, depth, "%d")] * block_count) % values
+        text = separator.join([self.get_block_format(block_shape, depth, "%r")] * block_count) % values
+        if "n" in text:
+            text = separator.join([self.get_block_format(block_shape, depth, "%s")] * block_count) % tuple(
+                [self.encode_value(value) for value in values])
+        return text
+
+    def format_numbers(self, o, start, stop, separator):
+        values = o.data[start:stop]
+        if not o.is_float():
+            return separator.join(map(str, values))
+        text = separator.join(map(repr, values))
+        if "n" in text:
+            # Only nan and inf contain an n. They are spelled the way json spells them, or rejected as json would.
+            text = separator.join([self.encode_value(value) for value in values])
+        return text
+
+    def iterencode_nodes(self, nodes, count, depth=0):
+        # Encode (entry, child nodes) pairs as an object keyed by entry.
+        yield "{"
+        indent_size = self.indent if count > 1 else 0
+        inner_depth = depth + 1
+        inner_indentation = self.get_indentation(indent_size, inner_depth)
+        for index, node in enumerate(nodes):
+            if index > 0:
+                yield ", "
+            yield inner_indentation
+            yield self.encode_value(node[0])
+            yield ": "
+            yield self.encode_node(node, inner_depth)
+        yield self.get_indentation(indent_size, depth)
+        yield "}"
+
+    def iterencode_node_list(self, nodes, count, depth=0):
+        # Children of arrays are wrapped in objects of their own, so that each keeps its title as a key.
+        yield "["
+        indent_size = self.indent if count > 1 else 0
+        inner_depth = depth + 1
+        inner_indentation = self.get_indentation(indent_size, inner_depth)
+        for index, node in enumerate(nodes):
+            if index > 0:
+                yield ", "
+            yield inner_indentation
+            yield self.iterencode_nodes([node], self.get_node_count(node), inner_depth)
+        yield self.get_indentation(indent_size, depth)
+        yield "]"
+
+    def encode_node(self, node, depth=0):
+        entry, child_nodes = node
+        if not child_nodes:
+            return self.encode_fragment(entry.value, depth)
+        elif isinstance(entry.value, list):
+            return self.iterencode_node_list(child_nodes, self.get_node_count(node), depth)
+        else:
+            return self.iterencode_nodes(child_nodes, self.get_node_count(node), depth)
+
+    def encode_fragment(self, o, depth=0):
+        # Scalars are encoded straight away, while containers are returned as generators for iterencode to enter.
+        if isinstance(o, (dict, list)):
+            return self.iterencode_container(o, depth)
+        elif isinstance(o, TypedArray):
+            return self.iterencode_typed_array(o, depth)
+        elif isinstance(o, AttributeSnapshot):
+            return self.iterencode_dict(o.as_dict(), depth)
+        elif isinstance(o, MeshGeometry):
+            return self.iterencode_dict(o, depth)
+        else:
+            return self.encode_value(o)
+
+    def join_container(self, opening, closing, items, count, depth=0):
+        # Join already encoded items the same way iterencode_dict and iterencode_list lay them out.
+        indent_size = self.indent if count > 1 else 0
+        inner_indentation = self.get_indentation(indent_size, depth + 1)
+        return "".join([opening, inner_indentation, (", " + inner_indentation).join(items),
+                        self.get_indentation(indent_size, depth), closing])
+
+    def iterencode_fragments(self, fragments, leaf_counts):
+        # Generators are walked with an explicit stack so that fragments are only handled once regardless of depth.
+        # They yield strings, or the generator of a nested container that must be entered.
+        self.leaf_counts = leaf_counts
+        try:
+            chunk = []
+            stack = [fragments]
+            while stack:
+                for fragment in stack[-1]:
+                    if isinstance(fragment, types.GeneratorType):
+                        stack.append(fragment)
+                        break
+                    chunk.append(fragment)
+                    if len(chunk) >= self.chunk_size:
+                        yield "".join(chunk)
+                        chunk = []
+                else:
+                    stack.pop()
+
+            if chunk:
+                yield "".join(chunk)
+        finally:
+            self.leaf_counts = {}
+
+    def iterencode(self, o, _one_shot=False, depth=0):
+        if isinstance(o, AttributeSnapshot):
+            o = o.as_dict()
+        if not isinstance(o, (dict, list, TypedArray, MeshGeometry)):
+            yield self.encode_value(o)
+            return
+
+        leaf_counts = self.count_leaves(o) if self.indent and isinstance(o, (dict, list)) else {}
+        for chunk in self.iterencode_fragments(self.encode_fragment(o, depth), leaf_counts):
+            yield chunk
+
+    def iterencode_tree(self, nodes):
+        # Encode (entry, child nodes) pairs, such as those held by File, without building intermediate containers.
+        if not nodes:
+            return
+
+        leaf_counts = self.count_tree_leaves(nodes) if self.indent else {}
+        fragments = self.iterencode_nodes(nodes, leaf_counts.get(id(nodes), 0))
+        for chunk in self.iterencode_fragments(fragments, leaf_counts):
+            yield chunk
+
+    def encode_value(self, o):
+        return "".join(super(EntryEncoder, self).iterencode(o, _one_shot=True))
+
+    def encode(self, o):
+        return "".join(self.iterencode(o))
 
     def default(self, o):
         if isinstance(o, Entry):
@@ -0,0 +1,17 @@
+class EntryKey(tuple):
+
+    # Identity of a node, or of an attribute of a node, as a (uuid, attribute path) pair. Entries compare and hash by
+    # their key, so that sets and dictionaries of entries never call into Maya. Nodes have no attribute path.
+
+    __slots__ = ()
+
+    def __new__(cls, uuid, path=None):
+        return tuple.__new__(cls, (uuid, path))
+
+    @property
+    def uuid(self):
+        return self[0]
+
+    @property
+    def path(self):
+        return self[1]
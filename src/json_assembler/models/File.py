@@ -1,8 +1,8 @@
-import json
-import io
-
+from CborEncoder import CborEncoder
 from EntryEncoder import EntryEncoder
-from EntryPreprocessor import EntryPreprocessor
+from MessagePackEncoder import MessagePackEncoder
+import encoder_backends
+import file_writers
 
 
 class File:
@@ -10,38 +10,209 @@ class File:
     def __init__(self):
         self.entries = set()
 
+        # Child nodes of each parent entry, ordered by position, with root entries held under None. Each node is an
+        # (entry, child nodes) pair that shares its list with the index, so the tree can be walked without lookups.
+        self.nodes_by_parent = {None: []}
+        self.unordered_parents = set()
+
+        # Parent each entry was indexed under. Entries are shared with the Explorer, which may set their parent
+        # while they are in the file, so entries are only moved through set_entry_parent.
+        self.parents = {}
+
+        # Encoded fragments of each entry's value as (depth, fragment, leaf count), valid for the fragment settings.
+        self.fragments = {}
+        self.fragment_settings = None
+
     def add_entry(self, entry):
+        if entry in self.entries:
+            return
         self.entries.add(entry)
+        self.insert_node(entry)
+        self.invalidate_entry(entry)
 
     def remove_entry(self, entry):
+        self.invalidate_entry(entry)
         self.entries.remove(entry)
+        self.take_node(entry)
 
     def add_entries(self, addition_data):
-        self.entries.update(addition_data)
+        for entry in addition_data:
+            self.add_entry(entry)
 
     def remove_entries(self, subtraction_data):
-        self.entries = self.entries.difference(subtraction_data)
+        for entry in subtraction_data:
+            if entry in self.entries:
+                self.remove_entry(entry)
 
     def clear_entries(self):
         self.entries = set()
+        self.nodes_by_parent = {None: []}
+        self.unordered_parents = set()
+        self.parents = {}
+        self.fragments = {}
+
+    def update_entry(self, entry):
+        self.invalidate_entry(entry)
+
+    def update_entries(self, entries):
+        for entry in entries:
+            if entry in self.entries:
+                self.invalidate_entry(entry)
+
+    def set_entry_parent(self, entry, parent):
+        self.invalidate_entry(entry)
+        self.take_node(entry)
+        entry.parent = parent
+        self.insert_node(entry)
+        self.invalidate_entry(entry)
+
+    def set_entry_position(self, entry, position):
+        if entry.position != position:
+            entry.position = position
+            # Siblings are usually renumbered one after another, so they are only reordered once next needed.
+            self.unordered_parents.add(self.get_parent(entry))
+            self.invalidate_entry(entry)
+
+    def get_child_nodes(self, entry):
+        if entry not in self.nodes_by_parent:
+            self.nodes_by_parent[entry] = []
+        return self.nodes_by_parent[entry]
+
+    def get_parent(self, entry):
+        return self.parents.get(entry, entry.parent)
+
+    def insert_node(self, entry):
+        self.parents[entry] = entry.parent
+        siblings = self.get_child_nodes(entry.parent)
+        index = len(siblings)
+        while index > 0 and siblings[index - 1][0].position > entry.position:
+            index -= 1
+        siblings.insert(index, (entry, self.get_child_nodes(entry)))
+
+    def take_node(self, entry):
+        # Entries are matched by equality, as entries equal to those held, such as node entries created again when a
+        # node is reselected, stand for them.
+        parent = self.parents.pop(entry)
+        siblings = self.nodes_by_parent[parent]
+        for index, (sibling, _) in enumerate(siblings):
+            if sibling == entry:
+                del siblings[index]
+                break
+        # Keep the children of removed entries indexed, as they are shown again if the entry is added back, until
+        # they are removed as well.
+        if entry not in self.entries and not self.nodes_by_parent.get(entry):
+            self.nodes_by_parent.pop(entry, None)
+        if parent is not None and parent not in self.entries and not siblings:
+            del self.nodes_by_parent[parent]
+
+    def invalidate_entry(self, entry):
+        # Discard the cached fragments along the path from the entry up to the root.
+        while entry is not None:
+            self.fragments.pop(entry, None)
+            entry = self.get_parent(entry)
+
+    def get_tree(self):
+        for parent in self.unordered_parents:
+            if parent in self.nodes_by_parent:
+                self.nodes_by_parent[parent].sort(key=lambda x: x[0].position)
+        self.unordered_parents.clear()
+        return self.nodes_by_parent[None]
+
+    def get_ordered_children(self, entry):
+        self.get_tree()
+        return [child for child, _ in self.nodes_by_parent.get(entry, [])]
 
     def get_children(self, entry):
+        self.get_tree()
         children = []
-        for child_entry in [x for x in self.entries if x.parent == entry]:
-            children.append(child_entry)
-            children.extend(self.get_children(child_entry))
+        stack = [self.nodes_by_parent.get(entry, [])]
+        while stack:
+            for child, child_nodes in stack.pop():
+                children.append(child)
+                stack.append(child_nodes)
         return children
 
-    def encode(self, include_indentation, indentation_size):
-        preprocessed_entries = EntryPreprocessor.preprocess(self.entries)
-        if len(preprocessed_entries) > 0:
-            if include_indentation:
-                return json.dumps(preprocessed_entries, ensure_ascii=False, cls=EntryEncoder, indent=indentation_size)
-            else:
-                return json.dumps(preprocessed_entries, ensure_ascii=False, cls=EntryEncoder)
+    @staticmethod
+    def get_encoder(include_indentation, indentation_size):
+        if include_indentation:
+            return EntryEncoder(ensure_ascii=False, indent=indentation_size)
         else:
+            return EntryEncoder(ensure_ascii=False)
+
+    def iterencode(self, include_indentation, indentation_size, backend=None):
+        if backend and not include_indentation:
+            text = encoder_backends.encode_tree(backend, self.get_tree())
+            if text is not None:
+                return iter([text] if text else [])
+        encoder = self.get_encoder(include_indentation, indentation_size)
+        return encoder.iterencode_tree(self.get_tree())
+
+    def encode(self, include_indentation, indentation_size, backend=None):
+        # Backends encode the whole file at once, and only support output without indentation.
+        if backend and not include_indentation:
+            text = encoder_backends.encode_tree(backend, self.get_tree())
+            if text is not None:
+                return text
+
+        # Only fragments invalidated since the previous call with the same settings are encoded again.
+        settings = (include_indentation, indentation_size)
+        if settings != self.fragment_settings:
+            self.fragments = {}
+            self.fragment_settings = settings
+
+        nodes = self.get_tree()
+        if not nodes:
             return ""
+        encoder = self.get_encoder(include_indentation, indentation_size)
+        items, count = self.encode_nodes(encoder, nodes, 0)
+        return encoder.join_container("{", "}", items, count)
+
+    def encode_nodes(self, encoder, nodes, depth):
+        items = []
+        count = 0
+        for node in nodes:
+            fragment, child_count = self.encode_node(encoder, node, depth + 1)
+            items.append(encoder.encode_value(node[0]) + ": " + fragment)
+            count += child_count
+        return items, count
+
+    def encode_node(self, encoder, node, depth):
+        entry, child_nodes = node
+        cached = self.fragments.get(entry)
+        if cached is not None and cached[0] == depth:
+            return cached[1:]
+
+        if not child_nodes:
+            fragment = "".join(encoder.iterencode(entry.value, depth=depth))
+            count = encoder.get_count(entry.value)
+        elif isinstance(entry.value, list):
+            # Children of arrays are wrapped in objects of their own, as in EntryEncoder.iterencode_node_list.
+            items = []
+            count = 0
+            for child_node in child_nodes:
+                child_items, child_count = self.encode_nodes(encoder, [child_node], depth + 1)
+                items.append(encoder.join_container("{", "}", child_items, child_count, depth + 1))
+                count += child_count
+            fragment = encoder.join_container("[", "]", items, count, depth)
+        else:
+            items, count = self.encode_nodes(encoder, child_nodes, depth)
+            fragment = encoder.join_container("{", "}", items, count, depth)
+
+        self.fragments[entry] = (depth, fragment, count)
+        return fragment, count
+
+    def save_to_file(self, path, include_indentation, indentation_size, backend=None,
+                     buffer_size=file_writers.default_buffer_size):
+        file_writers.write_chunks(path, self.iterencode(include_indentation, indentation_size, backend), buffer_size)
+
+    def iterencode_binary(self, encoder):
+        return encoder.iterencode_tree(self.get_tree())
+
+    def save_to_binary_file(self, path, encoder, buffer_size=file_writers.default_buffer_size):
+        file_writers.write_chunks(path, self.iterencode_binary(encoder), buffer_size)
+
+    def save_to_message_pack_file(self, path):
+        self.save_to_binary_file(path, MessagePackEncoder())
 
-    def save_to_file(self, path, include_indentation, indentation_size):
-        with io.open(path, 'w', encoding='utf-8') as f:
-            f.write(self.encode(include_indentation, indentation_size))
+    def save_to_cbor_file(self, path):
+        self.save_to_binary_file(path, CborEncoder())
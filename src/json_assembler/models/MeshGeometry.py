@@ -0,0 +1,28 @@
+from collections import OrderedDict
+
+
+class MeshGeometry(object):
+
+    # Geometry of a mesh held as a reader per component, each returning the component as a typed array. Components are
+    # only read while they are iterated over, so that encoders writing a mesh hold one component buffer at a time.
+
+    def __init__(self, component_readers=None):
+        self.component_readers = OrderedDict()
+        if component_readers is not None:
+            self.component_readers.update(component_readers)
+
+    def get_component(self, name):
+        return self.component_readers[name]()
+
+    def keys(self):
+        return list(self.component_readers.keys())
+
+    def items(self):
+        for name, reader in self.component_readers.items():
+            yield name, reader()
+
+    def as_dict(self):
+        return OrderedDict(self.items())
+
+    def __len__(self):
+        return len(self.component_readers)
@@ -0,0 +1,93 @@
+import struct
+
+from BinaryEncoder import BinaryEncoder, text_type
+
+
+class MessagePackEncoder(BinaryEncoder):
+
+    # Typed arrays are written as extension types. Both payloads start with the array type code as an ASCII byte,
+    # followed by the little-endian data for one dimensional arrays, or by the number of dimensions as a byte, each
+    # dimension as a little-endian uint32 and then the data for arrays of higher dimensions.
+    typed_array_extension_type = 1
+    shaped_array_extension_type = 2
+
+    def encode_nil(self):
+        return b"\xc0"
+
+    def encode_bool(self, o):
+        return b"\xc3" if o else b"\xc2"
+
+    def encode_int(self, o):
+        if 0 <= o < 0x80:
+            return struct.pack(">B", o)
+        elif -0x20 <= o < 0:
+            return struct.pack(">b", o)
+        elif 0 <= o <= 0xff:
+            return struct.pack(">BB", 0xcc, o)
+        elif 0 <= o <= 0xffff:
+            return struct.pack(">BH", 0xcd, o)
+        elif 0 <= o <= 0xffffffff:
+            return struct.pack(">BI", 0xce, o)
+        elif 0 <= o <= 0xffffffffffffffff:
+            return struct.pack(">BQ", 0xcf, o)
+        elif -0x80 <= o < 0:
+            return struct.pack(">Bb", 0xd0, o)
+        elif -0x8000 <= o < 0:
+            return struct.pack(">Bh", 0xd1, o)
+        elif -0x80000000 <= o < 0:
+            return struct.pack(">Bi", 0xd2, o)
+        elif -0x8000000000000000 <= o < 0:
+            return struct.pack(">Bq", 0xd3, o)
+        else:
+            raise OverflowError(repr(o) + " is out of range for MessagePack")
+
+    def encode_float(self, o):
+        return struct.pack(">Bd", 0xcb, o)
+
+    def encode_text(self, o):
+        if isinstance(o, text_type):
+            o = o.encode("utf-8")
+        length = len(o)
+        if length < 0x20:
+            return struct.pack(">B", 0xa0 | length) + o
+        elif length <= 0xff:
+            return struct.pack(">BB", 0xd9, length) + o
+        elif length <= 0xffff:
+            return struct.pack(">BH", 0xda, length) + o
+        else:
+            return struct.pack(">BI", 0xdb, length) + o
+
+    def encode_array_header(self, length):
+        if length < 0x10:
+            return struct.pack(">B", 0x90 | length)
+        elif length <= 0xffff:
+            return struct.pack(">BH", 0xdc, length)
+        else:
+            return struct.pack(">BI", 0xdd, length)
+
+    def encode_map_header(self, length):
+        if length < 0x10:
+            return struct.pack(">B", 0x80 | length)
+        elif length <= 0xffff:
+            return struct.pack(">BH", 0xde, length)
+        else:
+            return struct.pack(">BI", 0xdf, length)
+
+    def encode_extension(self, extension_type, data):
+        length = len(data)
+        if length in (1, 2, 4, 8, 16):
+            headers = {1: 0xd4, 2: 0xd5, 4: 0xd6, 8: 0xd7, 16: 0xd8}
+            return struct.pack(">Bb", headers[length], extension_type) + data
+        elif length <= 0xff:
+            return struct.pack(">BBb", 0xc7, length, extension_type) + data
+        elif length <= 0xffff:
+            return struct.pack(">BHb", 0xc8, length, extension_type) + data
+        else:
+            return struct.pack(">BIb", 0xc9, length, extension_type) + data
+
+    def encode_typed_array(self, typecode, shape, data):
+        typecode = typecode.encode("ascii")
+        if len(shape) == 1:
+            return self.encode_extension(self.typed_array_extension_type, typecode + data)
+        header = typecode + struct.pack("<B%dI" % len(shape), len(shape), *shape)
+        return self.encode_extension(self.shaped_array_extension_type, header + data)
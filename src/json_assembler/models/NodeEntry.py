@@ -1,15 +1,19 @@
 import maya.OpenMaya as om
+from collections import OrderedDict
 
 from AttributeEntry import AttributeEntry
 from Entry import Entry
+from EntryKey import EntryKey
 
 
 class NodeEntry(Entry):
 
     def __init__(self, node):
         self.node = node
-        self.node_name = self.get_node_name(self.node)
-        self.uuid = self.get_uuid()
+        dg_node_fn = om.MFnDependencyNode(node)
+        self.node_name = dg_node_fn.name()
+        self.uuid = dg_node_fn.uuid().asString()
+        self.key = EntryKey(self.uuid)
         super(NodeEntry, self).__init__(self.node_name)
         self.value = {}
 
@@ -48,20 +52,25 @@ class NodeEntry(Entry):
 
     def get_attribute_entries(self):
         depend_fn = om.MFnDependencyNode(self.node)
-        attribute_count = depend_fn.attributeCount()
         attributes = []
-        for attribute_index in range(attribute_count):
-            attribute_object = depend_fn.attribute(attribute_index)
-            attribute_plug = depend_fn.findPlug(attribute_object, True)
+        for descriptor in AttributeEntry.get_node_descriptors(depend_fn):
+            if descriptor.reader is AttributeEntry.read_unsupported:
+                continue
+            attribute_plug = depend_fn.findPlug(descriptor.attribute, True)
             try:
-                attributes.append(AttributeEntry(attribute_plug, attribute_object))
+                attributes.append(AttributeEntry(attribute_plug, descriptor.attribute, descriptor, self.uuid))
             except AttributeError:
                 continue
         return attributes
 
+    def get_attribute_samples(self, frames):
+        attribute_entries = self.get_attribute_entries()
+        return OrderedDict(zip([x.attribute_name for x in attribute_entries],
+                               AttributeEntry.get_samples(attribute_entries, frames)))
+
     def __eq__(self, other):
         if self.__class__ == other.__class__:
-            return self.node == other.node
+            return self.key == other.key
         else:
             return False
 
@@ -69,4 +78,4 @@ class NodeEntry(Entry):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.uuid)
+        return hash(self.key)
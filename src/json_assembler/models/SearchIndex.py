@@ -0,0 +1,102 @@
+import heapq
+import itertools
+
+from SearchMatcher import SearchMatcher
+
+
+class SearchIndex(object):
+
+    # Lowercased search paths of items, grouped so that the items of a group are indexed and dropped together. The
+    # items matching the current matcher are kept up to date as groups change, so that a matcher whose matches are a
+    # subset of the previous matches only narrows them rather than scanning every path again. Items are held by ids,
+    # which hash far faster than the items themselves, and only the items whose match changed are looked up.
+
+    def __init__(self):
+        self.item_ids = itertools.count()
+        self.items = {}
+        self.paths = {}
+        self.groups = {}
+        self.ids_by_item = {}
+        self.ids_by_group = {}
+        self.matcher = SearchMatcher()
+        self.matches = set()
+        self.match_counts = {}
+
+    def add_group(self, group, items):
+        # Index (item, path) pairs as the items of a group, replacing any items indexed for it before.
+        self.remove_group(group)
+        group_ids = []
+        match_count = 0
+        for item, path in items:
+            item_id = next(self.item_ids)
+            path = path.lower()
+            self.items[item_id] = item
+            self.paths[item_id] = path
+            self.groups[item_id] = group
+            self.ids_by_item[item] = item_id
+            group_ids.append(item_id)
+            if self.matcher.is_match(path):
+                self.matches.add(item_id)
+                match_count += 1
+        self.ids_by_group[group] = group_ids
+        self.match_counts[group] = match_count
+
+    def remove_group(self, group):
+        for item_id in self.ids_by_group.pop(group, ()):
+            del self.ids_by_item[self.items.pop(item_id)]
+            del self.paths[item_id]
+            del self.groups[item_id]
+            self.matches.discard(item_id)
+        self.match_counts.pop(group, None)
+
+    def clear(self):
+        for group in list(self.ids_by_group):
+            self.remove_group(group)
+
+    def search(self, term, mode="substring"):
+        # Match the items whose path matches the term in the given mode, and return the items that started and
+        # stopped matching.
+        matcher = SearchMatcher(term, mode)
+        paths = self.paths
+        if matcher.narrows(self.matcher):
+            matches = set(matcher.get_matches([(x, paths[x]) for x in self.matches]))
+            added_matches = set()
+        else:
+            matches = set(matcher.get_matches(paths.items()))
+            added_matches = matches - self.matches
+        return self.set_matches(matcher, matches, added_matches, self.matches - matches)
+
+    def set_matches(self, matcher, matches, added_matches, removed_matches):
+        for item_id in added_matches:
+            self.match_counts[self.groups[item_id]] += 1
+        for item_id in removed_matches:
+            self.match_counts[self.groups[item_id]] -= 1
+        self.matcher = matcher
+        self.matches = matches
+        return [self.items[x] for x in added_matches], [self.items[x] for x in removed_matches]
+
+    def get_matching_items(self):
+        return [self.items[x] for x in self.matches]
+
+    def get_ranked_items(self, count=None):
+        # Matching items from best to worst, or the best count of them. Ties keep the order items were indexed in.
+        get_score = self.matcher.get_score
+        paths = self.paths
+        scored_ids = [(get_score(paths[x]), x) for x in self.matches]
+        if count is None:
+            scored_ids.sort()
+        else:
+            scored_ids = heapq.nsmallest(count, scored_ids)
+        return [self.items[x] for _, x in scored_ids]
+
+    def is_match(self, item):
+        return self.ids_by_item.get(item) in self.matches
+
+    def get_match_count(self, group):
+        return self.match_counts.get(group, 0)
+
+    def is_indexed(self, group):
+        return group in self.ids_by_group
+
+    def __len__(self):
+        return len(self.paths)
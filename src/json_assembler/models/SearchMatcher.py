@@ -0,0 +1,76 @@
+import fnmatch
+import re
+
+
+class SearchMatcher(object):
+
+    # A search term compiled once into a regular expression matching lowercased paths, whatever the search mode.
+    # Substring terms match anywhere, globs without wildcards match as if surrounded by *, regular expressions are
+    # searched for ignoring case, and fuzzy terms match paths holding their characters in order.
+
+    modes = ["substring", "glob", "regex", "fuzzy"]
+
+    def __init__(self, term="", mode="substring"):
+        if mode not in self.modes:
+            raise ValueError("Unknown search mode " + repr(mode))
+        self.term = term.lower()
+        self.mode = mode
+        self.error = None
+        try:
+            self.pattern = self.compile(term, mode)
+        except re.error as error:
+            # Regular expressions are compiled as they are typed, so an incomplete one matches nothing.
+            self.error = error
+            self.pattern = None
+
+    @classmethod
+    def compile(cls, term, mode):
+        if mode == "substring":
+            return re.compile(re.escape(term.lower()))
+        elif mode == "glob":
+            term = term.lower()
+            if not any(character in term for character in "*?["):
+                term = "*" + term + "*"
+            # Globs match whole paths, so anchoring them spares searching from every position of a path.
+            return re.compile("^" + fnmatch.translate(term))
+        elif mode == "regex":
+            return re.compile(term, re.IGNORECASE)
+        else:
+            # Skipping to each character with a negated class rather than .*? spares backtracking paths that miss.
+            term = term.lower()
+            return re.compile("".join([("[^%s]*" % re.escape(character) if index else "") + re.escape(character)
+                                       for index, character in enumerate(term)]))
+
+    def is_match(self, path):
+        return self.pattern is not None and self.pattern.search(path) is not None
+
+    def get_matches(self, items):
+        # Return the ids of the (id, path) pairs whose path matches.
+        if self.pattern is None:
+            return []
+        search = self.pattern.search
+        return [item_id for item_id, path in items if search(path)]
+
+    def get_score(self, path):
+        # Shorter matches rank first, then matches starting a name, earlier matches and shorter paths.
+        match = self.pattern.search(path)
+        start = match.start()
+        at_name_start = start == 0 or path[start - 1] in "._|:"
+        return match.end() - start, not at_name_start, start, len(path)
+
+    def narrows(self, matcher):
+        # Whether every path matched by this matcher is matched by the given matcher as well, so that searching can
+        # start from its matches.
+        if matcher is None or matcher.pattern is None or self.pattern is None:
+            return False
+        elif matcher.mode == "substring" and self.mode == "substring":
+            return matcher.term in self.term
+        elif matcher.mode == "fuzzy" and self.mode in ("substring", "fuzzy"):
+            return self.is_subsequence(matcher.term, self.term)
+        else:
+            return not matcher.term and matcher.mode in ("substring", "fuzzy")
+
+    @staticmethod
+    def is_subsequence(term, text):
+        characters = iter(text)
+        return all(character in characters for character in term)
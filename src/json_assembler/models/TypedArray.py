@@ -0,0 +1,117 @@
+import array
+
+try:
+    integer_types = (int, long)
+except NameError:
+    integer_types = (int,)
+
+# Type code of 64 bit integers, or None when there is none. Python 2 has no long long type code, so long stands in
+# where it is 64 bits wide, as on 64 bit Linux and macOS but not on Windows.
+try:
+    array.array('q')
+    INT64_TYPECODE = 'q'
+except ValueError:
+    INT64_TYPECODE = 'l' if array.array('l').itemsize == 8 else None
+
+
+class TypedArray(object):
+
+    # Numeric values held in a flat array.array buffer together with the shape of the nested lists they stand for, so
+    # that dense attribute values such as point arrays do not need a Python object per number.
+
+    float_typecodes = 'fd'
+
+    def __init__(self, typecode, values=(), shape=None):
+        self.data = values if isinstance(values, array.array) else array.array(typecode, values)
+        if self.data.typecode != typecode:
+            self.data = array.array(typecode, self.data)
+        self.shape = tuple(shape) if shape is not None else (len(self.data),)
+        if self.size != len(self.data):
+            raise ValueError("Shape " + repr(self.shape) + " does not match " + str(len(self.data)) + " values")
+
+    @property
+    def typecode(self):
+        return self.data.typecode
+
+    @property
+    def size(self):
+        return self.get_shape_size(self.shape)
+
+    @staticmethod
+    def get_shape_size(shape):
+        size = 1
+        for dimension in shape:
+            size *= dimension
+        return size
+
+    @staticmethod
+    def pack(values):
+        # Pack numbers, or typed arrays sharing a shape, into a single typed array. Other values are left in a list.
+        if isinstance(values, TypedArray) or not values:
+            return values
+        elif all(isinstance(x, TypedArray) for x in values):
+            first = values[0]
+            if any(x.typecode != first.typecode or x.shape != first.shape for x in values):
+                return list(values)
+            data = array.array(first.typecode)
+            for value in values:
+                data.extend(value.data)
+            return TypedArray(first.typecode, data, (len(values),) + first.shape)
+        elif all(isinstance(x, integer_types) and not isinstance(x, bool) for x in values):
+            if INT64_TYPECODE is None:
+                return list(values)
+            try:
+                return TypedArray(INT64_TYPECODE, values)
+            except OverflowError:
+                return list(values)
+        elif all(isinstance(x, integer_types + (float,)) and not isinstance(x, bool) for x in values):
+            return TypedArray('d', values)
+        else:
+            return list(values)
+
+    def is_float(self):
+        return self.typecode in self.float_typecodes
+
+    def get_row_size(self):
+        return self.size // self.shape[0] if self.shape[0] else 0
+
+    def tolist(self):
+        values = self.data.tolist()
+        for index in range(len(self.shape) - 1, 0, -1):
+            dimension = self.shape[index]
+            values = [values[i * dimension:(i + 1) * dimension] for i in range(self.get_shape_size(self.shape[:index]))]
+        return values
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        if len(self.shape) == 1:
+            return iter(self.data)
+        return (self[index] for index in range(self.shape[0]))
+
+    def __getitem__(self, index):
+        if len(self.shape) == 1:
+            return self.data[index]
+        if index < 0:
+            index += self.shape[0]
+        if not 0 <= index < self.shape[0]:
+            raise IndexError("TypedArray index out of range")
+        row_size = self.get_row_size()
+        return TypedArray(self.typecode, self.data[index * row_size:(index + 1) * row_size], self.shape[1:])
+
+    def __eq__(self, other):
+        if isinstance(other, TypedArray):
+            return self.shape == other.shape and self.data == other.data
+        elif isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        else:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "TypedArray(" + ", ".join([repr(self.typecode), repr(self.data.tolist()), repr(self.shape)]) + ")"
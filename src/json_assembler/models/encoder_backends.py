@@ -0,0 +1,158 @@
+import json
+import math
+from collections import OrderedDict
+
+from AttributeSnapshot import AttributeSnapshot
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
+
+# Encoding functions by name, in order of preference. Each takes a structure of dictionaries, lists and scalars with
+# string keys and returns its compact JSON representation.
+backends = OrderedDict()
+
+# Backends which cannot write NaN and Infinity as EntryEncoder does, and are skipped for data holding them.
+finite_only_backends = set()
+
+# Backends encoding faster than EntryEncoder, which are the only ones tried with "auto". Others are only used when
+# named, as they cost a plain copy of the whole tree without saving time over EntryEncoder.
+accelerated_backends = set()
+
+
+def register_backend(name, dumps, allow_nan=True, accelerated=True):
+    backends[name] = dumps
+    if allow_nan:
+        finite_only_backends.discard(name)
+    else:
+        finite_only_backends.add(name)
+    if accelerated:
+        accelerated_backends.add(name)
+    else:
+        accelerated_backends.discard(name)
+
+
+def deregister_backend(name):
+    backends.pop(name, None)
+    finite_only_backends.discard(name)
+    accelerated_backends.discard(name)
+
+
+def get_backend_names():
+    return list(backends.keys())
+
+
+def get_accelerated_backend_names():
+    return [x for x in backends if x in accelerated_backends]
+
+
+def get_backend(name):
+    if name == "auto":
+        name = next(iter(get_accelerated_backend_names()), None)
+    return backends.get(name)
+
+
+def get_plain_tree(nodes):
+    # Convert (entry, child nodes) pairs into dictionaries keyed by title. Entries sharing a title within the same
+    # parent cannot be represented this way, in which case None is returned.
+    plain_tree = OrderedDict()
+    for entry, child_nodes in nodes:
+        if child_nodes:
+            if isinstance(entry.value, list):
+                value = []
+                for child_node in child_nodes:
+                    child_value = get_plain_tree([child_node])
+                    if child_value is None:
+                        return None
+                    value.append(child_value)
+            else:
+                value = get_plain_tree(child_nodes)
+                if value is None:
+                    return None
+        else:
+            value = get_plain_value(entry.value)
+        plain_tree[entry.title] = value
+    if len(plain_tree) < len(nodes):
+        return None
+    return plain_tree
+
+
+def get_plain_value(value):
+    # Typed arrays, snapshots and meshes are handed to backends as the lists and dictionaries they stand for.
+    if isinstance(value, TypedArray):
+        return value.tolist()
+    elif isinstance(value, AttributeSnapshot):
+        plain_value = value.as_dict()
+        plain_value["attributes"] = OrderedDict([(name, get_plain_value(column))
+                                                 for name, column in value.columns.items()])
+        return plain_value
+    elif isinstance(value, MeshGeometry):
+        return OrderedDict([(name, get_plain_value(component)) for name, component in value.items()])
+    else:
+        return value
+
+
+def has_non_finite_values(value):
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if math.isnan(value) or math.isinf(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def encode_tree(name, nodes):
+    # Encode (entry, child nodes) pairs without indentation using the named backend, or with "auto" the first
+    # accelerated backend able to. None is returned whenever no backend is available or can represent the data, so
+    # that callers can fall back to EntryEncoder.
+    names = [x for x in (get_accelerated_backend_names() if name == "auto" else [name]) if x in backends]
+    if not names:
+        return None
+    elif not nodes:
+        return ""
+    plain_tree = get_plain_tree(nodes)
+    if plain_tree is None:
+        return None
+    non_finite = None
+    for name in names:
+        if name in finite_only_backends:
+            if non_finite is None:
+                non_finite = has_non_finite_values(plain_tree)
+            if non_finite:
+                continue
+        try:
+            return backends[name](plain_tree)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return None
+
+
+def register_default_backends():
+    try:
+        import orjson
+        # orjson writes NaN and Infinity as null.
+        register_backend("orjson", lambda data: orjson.dumps(data).decode("utf-8"), allow_nan=False)
+    except ImportError:
+        pass
+
+    try:
+        import rapidjson
+        register_backend("rapidjson", lambda data: rapidjson.dumps(data, ensure_ascii=False))
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+        register_backend("ujson", lambda data: ujson.dumps(data, ensure_ascii=False))
+    except ImportError:
+        pass
+
+    # The standard library's C encoder produces the same separators as EntryEncoder's compact mode, but is no faster
+    # once the plain copy of the tree it needs is made.
+    register_backend("json", lambda data: json.dumps(data, ensure_ascii=False), accelerated=False)
+
+
+register_default_backends()
@@ -0,0 +1,106 @@
+import bz2
+import io
+import os
+import shutil
+import sys
+import tempfile
+import zlib
+from collections import OrderedDict
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+# Size in bytes of the buffer between the encoder and the file on disk.
+default_buffer_size = 1024 * 1024
+
+# Functions creating incremental compressors by file extension. Each compressor provides compress(data) and flush(),
+# as the compressors of zlib, bz2 and lzma do.
+compressors = OrderedDict()
+
+
+def register_compressor(extension, create_compressor):
+    compressors[extension.lower()] = create_compressor
+
+
+def deregister_compressor(extension):
+    compressors.pop(extension.lower(), None)
+
+
+def get_compressor_extensions():
+    return list(compressors.keys())
+
+
+def get_compressor(path):
+    extension = os.path.splitext(path)[1].lower()
+    create_compressor = compressors.get(extension)
+    return create_compressor() if create_compressor is not None else None
+
+
+def get_default_mode():
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def replace_file(source, destination):
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+    else:
+        # Python 2 cannot rename over an existing file on Windows.
+        if sys.platform == 'win32' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
+
+
+def write_chunks(path, chunks, buffer_size=default_buffer_size):
+    # Stream text or byte chunks to a temporary file next to path, compressing them when the extension of path has a
+    # registered compressor, and move it over path once every chunk has been written. Should encoding fail, path is
+    # left untouched.
+    directory, name = os.path.split(os.path.abspath(path))
+    handle, temporary_path = tempfile.mkstemp(prefix="." + name + ".", suffix=".tmp", dir=directory)
+    try:
+        with io.open(handle, 'wb', buffering=buffer_size) as f:
+            compressor = get_compressor(path)
+            for chunk in chunks:
+                if isinstance(chunk, text_type):
+                    chunk = chunk.encode('utf-8')
+                if compressor is not None:
+                    chunk = compressor.compress(chunk)
+                f.write(chunk)
+            if compressor is not None:
+                f.write(compressor.flush())
+            f.flush()
+            os.fsync(f.fileno())
+
+        if os.path.exists(path):
+            shutil.copymode(path, temporary_path)
+        else:
+            os.chmod(temporary_path, get_default_mode())
+        replace_file(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def register_default_compressors():
+    # A window size of 31 makes zlib write the gzip format.
+    register_compressor(".gz", lambda: zlib.compressobj(6, zlib.DEFLATED, 31))
+    register_compressor(".bz2", bz2.BZ2Compressor)
+
+    try:
+        import lzma
+        register_compressor(".xz", lzma.LZMACompressor)
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+        register_compressor(".zst", lambda: zstandard.ZstdCompressor().compressobj())
+    except ImportError:
+        pass
+
+
+register_default_compressors()
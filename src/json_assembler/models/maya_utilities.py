@@ -1,5 +1,9 @@
+import maya.cmds as cmds
 import maya.OpenMaya as om
+from collections import OrderedDict
 
+from AttributeEntry import AttributeEntry
+from AttributeSnapshot import AttributeSnapshot
 from NodeEntry import NodeEntry
 
 
@@ -16,6 +20,26 @@ def get_nodes_from_selection():
     return selected_nodes
 
 
+def get_node_uuids_from_selection():
+    # A single command lists the selection by uuid, in selection order.
+    return cmds.ls(selection=True, uuid=True) or []
+
+
+def get_node_from_uuid(uuid):
+    # Nodes can share a uuid, as after importing or referencing a file twice, in which case a selected node is chosen
+    # over the others.
+    node_names = cmds.ls(uuid, long=True) or []
+    if not node_names:
+        raise RuntimeError("No node has the uuid " + uuid)
+    elif len(node_names) > 1:
+        node_names = cmds.ls(node_names, selection=True, long=True) or node_names
+    selection_list = om.MSelectionList()
+    selection_list.add(node_names[0])
+    node = om.MObject()
+    selection_list.getDependNode(0, node)
+    return node
+
+
 def get_entries_from_nodes(nodes):
     return [NodeEntry(node) for node in nodes]
 
@@ -25,12 +49,61 @@ def get_entries_from_selection():
     return get_entries_from_nodes(nodes)
 
 
+def get_attribute_snapshot(nodes, attribute_names):
+    # Read the named attributes of every node in a single pass over the nodes. Static attributes are described once
+    # per node type and then found by attribute rather than by name. Attributes a node lacks, or that cannot be read,
+    # are left as None.
+    node_names = []
+    node_uuids = []
+    columns = OrderedDict([(name, []) for name in attribute_names])
+    descriptors = {}
+    for node in nodes:
+        depend_fn = om.MFnDependencyNode(node)
+        node_type = depend_fn.typeName()
+        node_names.append(depend_fn.name())
+        node_uuids.append(depend_fn.uuid().asString())
+        for name, column in columns.items():
+            descriptor = descriptors.get((node_type, name))
+            try:
+                if descriptor is not None:
+                    plug = depend_fn.findPlug(descriptor.attribute, True)
+                else:
+                    plug = depend_fn.findPlug(name, True)
+                    descriptor = AttributeEntry.get_descriptor(node_type, plug, plug.attribute())
+                    if not descriptor.dynamic:
+                        descriptors[(node_type, name)] = descriptor
+                column.append(descriptor.reader(plug, descriptor.attribute))
+            except RuntimeError:
+                column.append(None)
+    return AttributeSnapshot(node_names, node_uuids, columns)
+
+
+def get_attribute_snapshot_from_selection(attribute_names):
+    return get_attribute_snapshot(get_nodes_from_selection(), attribute_names)
+
+
+def get_playback_frames(step=1.0):
+    # Frames of the playback range, including its end frame when the range is a whole number of steps.
+    start_frame = om.MAnimControl.minTime().value()
+    end_frame = om.MAnimControl.maxTime().value()
+    frame_count = int((end_frame - start_frame) / step + 1e-6) + 1
+    return [start_frame + index * step for index in range(max(frame_count, 0))]
+
+
 def register_selection_changed_callback(callback):
     event_message = om.MEventMessage()
     callback_id = event_message.addEventCallback("SelectionChanged", lambda *args: callback())
     return callback_id
 
 
+def register_name_changed_callback(callback):
+    # The callback is given the uuid and new name of any renamed node.
+    def on_name_changed(node, previous_name, *args):
+        dg_node_fn = om.MFnDependencyNode(node)
+        callback(dg_node_fn.uuid().asString(), dg_node_fn.name())
+    return om.MNodeMessage.addNameChangedCallback(om.MObject(), on_name_changed)
+
+
 def deregister_callbacks(callback_ids):
     message = om.MMessage()
     for callback_id in callback_ids:
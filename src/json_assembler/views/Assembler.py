@@ -5,6 +5,8 @@ import maya.OpenMayaUI as omui
 from Outliner import Outliner
 from Explorer import Explorer
 from Previewer import Previewer
+from ..models import encoder_backends
+from ..models import file_writers
 from ..models import maya_utilities
 
 
@@ -15,6 +17,11 @@ def get_maya_main_window():
 
 class Assembler(QtWidgets.QDialog):
 
+    # Accelerated backend saving files without indentation, falling back to EntryEncoder whenever it cannot. Files are
+    # saved with EntryEncoder unless a backend is picked, which is never used for previews as it skips the cached
+    # fragments and copies the whole tree.
+    encoder_backend = None
+
     def __init__(self, parent=get_maya_main_window()):
         super(Assembler, self).__init__(parent)
 
@@ -35,6 +42,14 @@ class Assembler(QtWidgets.QDialog):
         self.save_with_indentation_action = QtWidgets.QAction("Save With Indentation", self)
         self.save_with_indentation_action.setCheckable(True)
         self.save_with_indentation_action.setChecked(False)
+        self.encoder_backend_menu = QtWidgets.QMenu("Save Encoder", self)
+        self.encoder_backend_group = QtWidgets.QActionGroup(self)
+        for name in [None] + encoder_backends.get_accelerated_backend_names():
+            action = self.encoder_backend_group.addAction(name or "Default")
+            action.setData(name or "")
+            action.setCheckable(True)
+            action.setChecked(name == self.encoder_backend)
+        self.encoder_backend_menu.setEnabled(len(self.encoder_backend_group.actions()) > 1)
 
         self.display_menu = self.menu_bar.addMenu("Display")
         self.show_non_keyable_action = self.create_filter_action("Show Non-Keyable", True)
@@ -87,6 +102,8 @@ class Assembler(QtWidgets.QDialog):
     def create_layouts(self):
         self.file_menu.addAction(self.save_action)
         self.file_menu.addAction(self.save_with_indentation_action)
+        self.file_menu.addMenu(self.encoder_backend_menu)
+        self.encoder_backend_menu.addActions(self.encoder_backend_group.actions())
 
         self.display_menu.addAction(self.show_non_keyable_action)
         self.display_menu.addAction(self.show_connected_only_action)
@@ -142,6 +159,7 @@ class Assembler(QtWidgets.QDialog):
         self.add_button.clicked.connect(self.on_add_button_clicked)
         self.remove_button.clicked.connect(self.on_remove_button_clicked)
         self.save_action.triggered.connect(self.save_to_file)
+        self.encoder_backend_group.triggered.connect(self.on_encoder_backend_triggered)
 
         self.include_indentation_button.toggled.connect(self.refresh)
         self.indentation_size_field.valueChanged.connect(self.refresh)
@@ -174,11 +192,26 @@ class Assembler(QtWidgets.QDialog):
         self.previewer.set_current_widget_contents(text)
 
     def save_to_file(self):
-        path = QtWidgets.QFileDialog.getSaveFileName(self, "Save As", "", "JSON (*.json)")
+        formats = [("JSON", ".json"), ("MessagePack", ".msgpack"), ("CBOR", ".cbor")]
+        extensions = [""] + file_writers.get_compressor_extensions()
+        filters = ["{0} ({1})".format(name, " ".join(["*" + x + y for y in extensions])) for name, x in formats]
+        path = QtWidgets.QFileDialog.getSaveFileName(self, "Save As", "", ";;".join(filters))
         if len(path[0]) > 0:
-            include_indentation = self.save_with_indentation_action.isChecked()
-            indentation_size = self.indentation_size_field.value()
-            self.get_active_file().save_to_file(path[0], include_indentation, indentation_size)
+            if path[1].startswith("MessagePack"):
+                self.get_active_file().save_to_message_pack_file(path[0])
+            elif path[1].startswith("CBOR"):
+                self.get_active_file().save_to_cbor_file(path[0])
+            else:
+                include_indentation = self.save_with_indentation_action.isChecked()
+                indentation_size = self.indentation_size_field.value()
+                # Backends other than accelerated ones only copy the tree without saving time over EntryEncoder.
+                backend = self.encoder_backend
+                if backend not in encoder_backends.get_accelerated_backend_names():
+                    backend = None
+                self.get_active_file().save_to_file(path[0], include_indentation, indentation_size, backend)
+
+    def on_encoder_backend_triggered(self, action):
+        self.encoder_backend = action.data() or None
 
     def on_add_button_clicked(self):
         data = self.explorer.get_selected_entries(True)
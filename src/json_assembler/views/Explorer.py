@@ -1,13 +1,30 @@
 from PySide2 import QtWidgets, QtCore, QtGui
+from collections import deque
+import functools
+import time
 
 from ..models.AttributeEntry import AttributeEntry
+from ..models.NodeEntry import NodeEntry
+from ..models.SearchIndex import SearchIndex
+from ..models.SearchMatcher import SearchMatcher
 from ..models import maya_utilities
+from ExplorerModel import ExplorerModel
+from ExplorerProxyModel import ExplorerProxyModel
 
 
 class Explorer(QtWidgets.QWidget):
 
     selection_activated = QtCore.Signal()
 
+    # Milliseconds over which bursts of selection changes are merged into a single refresh.
+    selection_debounce_interval = 100
+
+    # Milliseconds spent listing the attributes of queued nodes each time the event loop is idle.
+    loading_time_slice = 10
+
+    # Largest number of search matches ranked, beyond which matches follow the ranked ones in their own order.
+    ranked_match_limit = 10000
+
     def __init__(self, parent=None):
         super(Explorer, self).__init__(parent)
 
@@ -22,10 +39,14 @@ class Explorer(QtWidgets.QWidget):
         self.show_non_keyable_enabled = True
         self.show_connected_only_enabled = False
         self.show_hidden_enabled = False
-        self.expanded_items = []
+        self.loading_queue = deque()
+        self.loading_generation = 0
         self.callback_ids = []
-        self.callback_ids.append(maya_utilities.register_selection_changed_callback(self.refresh))
+        self.callback_ids.append(maya_utilities.register_selection_changed_callback(self.schedule_refresh))
+        self.callback_ids.append(maya_utilities.register_name_changed_callback(self.on_node_name_changed))
         self.search_term = ""
+        self.search_mode = "substring"
+        self.search_index = SearchIndex()
 
         self.populate()
 
@@ -41,10 +62,22 @@ class Explorer(QtWidgets.QWidget):
         self.search_bar = QtWidgets.QLineEdit()
         self.search_bar.setPlaceholderText("Search...")
 
-        self.tree_widget = QtWidgets.QTreeWidget()
+        self.search_mode_field = QtWidgets.QComboBox()
+        self.search_mode_field.setView(QtWidgets.QListView())
+        for mode in SearchMatcher.modes:
+            self.search_mode_field.addItem(mode.capitalize(), mode)
+
+        self.model = ExplorerModel(self.check_filters, self)
+        self.proxy_model = ExplorerProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.tree_widget = QtWidgets.QTreeView()
+        self.tree_widget.setModel(self.proxy_model)
         self.tree_widget.setSelectionMode(self.tree_widget.ExtendedSelection)
         self.tree_widget.setHeaderHidden(True)
 
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+
         self.context_menu = QtWidgets.QMenu(self)
         self.add_action = self.context_menu.addAction("Add")
         self.remove_action = self.context_menu.addAction("Remove")
@@ -53,13 +86,21 @@ class Explorer(QtWidgets.QWidget):
         main_layout = QtWidgets.QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self.title_label)
-        main_layout.addWidget(self.search_bar)
+        search_layout = QtWidgets.QHBoxLayout()
+        search_layout.addWidget(self.search_bar)
+        search_layout.addWidget(self.search_mode_field)
+        main_layout.addLayout(search_layout)
         main_layout.addWidget(self.tree_widget)
         self.setLayout(main_layout)
 
     def create_connections(self):
-        self.tree_widget.itemSelectionChanged.connect(self.on_item_selection_changed)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.model.attribute_rows_changed.connect(self.index_node)
+        self.model.nodes_removed.connect(self.unindex_nodes)
+        self.tree_widget.selectionModel().selectionChanged.connect(self.on_item_selection_changed)
         self.search_bar.textEdited.connect(self.on_search_bar_text_edited)
+        self.search_bar.returnPressed.connect(self.on_search_bar_return_pressed)
+        self.search_mode_field.currentIndexChanged.connect(self.on_search_mode_field_current_index_changed)
         self.customContextMenuRequested.connect(self.on_context_menu_requested)
         self.add_action.triggered.connect(self.parent().on_add_button_clicked)
         self.remove_action.triggered.connect(self.parent().on_remove_button_clicked)
@@ -68,24 +109,17 @@ class Explorer(QtWidgets.QWidget):
         return QtCore.QSize(225, 225)
 
     def populate(self):
-        for node in maya_utilities.get_entries_from_selection():
-            item = QtWidgets.QTreeWidgetItem([node.title])
-            item.setData(0, QtCore.Qt.UserRole, node)
-            self.tree_widget.addTopLevelItem(item)
-
-            attributes = node.get_attribute_entries()
-            for attribute in attributes:
-                if not self.check_filters(attribute):
-                    continue
-                child_item = QtWidgets.QTreeWidgetItem([attribute.title])
-                child_item.setData(0, QtCore.Qt.UserRole, attribute)
-                item.addChild(child_item)
-
-            # Expand item if expanded at the time of refresh.
-            if node in self.expanded_items:
-                item.setExpanded(True)
-
-        self.search(self.search_term)
+        # The selection is diffed by uuid against the listed nodes, so only nodes which were selected or deselected
+        # are worked on. Attribute rows are created when a node is expanded or its attributes are loaded.
+        uuids = maya_utilities.get_node_uuids_from_selection()
+        if len(set(uuids)) < len(uuids):
+            maya_utilities.display_warning("Selected nodes sharing a uuid are only listed once in the Explorer.")
+        self.loading_queue.extend(self.model.update_nodes(uuids, self.create_node_entry))
+        self.start_loading()
+
+    @staticmethod
+    def create_node_entry(uuid):
+        return NodeEntry(maya_utilities.get_node_from_uuid(uuid))
 
     def check_filters(self, data):
         if isinstance(data, AttributeEntry):
@@ -101,45 +135,116 @@ class Explorer(QtWidgets.QWidget):
             return True
 
     def refresh(self):
-        # Store which top level items are expanded in order to preserve the current layout.
-        self.expanded_items = []
-        for item_index in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(item_index)
-            if item.isExpanded():
-                item_data = item.data(0, QtCore.Qt.UserRole)
-                self.expanded_items.append(item_data)
-
-        # Clear and repopulate the widget.
-        self.tree_widget.clear()
+        self.refresh_timer.stop()
         self.populate()
 
+    def schedule_refresh(self):
+        # Restarting the timer on every selection change merges bursts of changes.
+        self.refresh_timer.start(self.selection_debounce_interval)
+
+    def set_selection_debounce_interval(self, interval):
+        self.selection_debounce_interval = interval
+
+    def start_loading(self):
+        # Slices already scheduled belong to an earlier generation and stop, so that a single chain of slices runs.
+        self.loading_generation += 1
+        if self.loading_queue:
+            QtCore.QTimer.singleShot(0, functools.partial(self.load_attributes, self.loading_generation))
+
+    def load_attributes(self, generation):
+        # List the attributes of queued nodes until the time slice runs out, then give way to the event loop. Nodes
+        # deselected since they were queued are dropped.
+        if generation != self.loading_generation:
+            return
+        end_time = time.time() + self.loading_time_slice / 1000.0
+        while self.loading_queue and time.time() < end_time:
+            node = self.loading_queue.popleft()
+            if self.model.is_listed(node) and not self.model.is_fetched(node):
+                self.model.fetch_node(node)
+        if self.loading_queue:
+            QtCore.QTimer.singleShot(0, functools.partial(self.load_attributes, generation))
+
+    def refilter(self):
+        self.model.refilter()
+
     def search(self, term):
+        # Only rows whose match changed are shown or hidden. Whether there is a term at all also decides whether
+        # nodes without matching attributes are shown, so every node is then updated.
+        previous_term = self.search_term
         self.search_term = term
-        for item_index in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(item_index)
-            item_text = item.text(0)
-            hidden_count = 0
-            for child_index in range(item.childCount()):
-                child_item = item.child(child_index)
-                child_text = child_item.text(0)
-                if term.lower() not in (item_text + "." + child_text).lower():
-                    child_item.setHidden(True)
-                    hidden_count += 1
-                else:
-                    child_item.setHidden(False)
-            if hidden_count == item.childCount():
-                item.setHidden(True)
-            else:
-                item.setHidden(False)
+        added_matches, removed_matches = self.search_index.search(term, self.search_mode)
+        changed_nodes = set()
+        for matches, hidden in [(added_matches, False), (removed_matches, True)]:
+            node_indexes = {}
+            for node, row in matches:
+                node_index = node_indexes.get(node)
+                if node_index is None:
+                    node_index = node_indexes[node] = self.model.get_node_index(node)
+                self.set_row_hidden(self.model.index(row, 0, node_index), hidden)
+            changed_nodes.update(node_indexes)
+        if bool(previous_term) != bool(term):
+            changed_nodes = self.model.nodes
+        for node in changed_nodes:
+            self.update_node_visibility(node)
+
+        # Incomplete regular expressions match nothing, and say why.
+        error = self.search_index.matcher.error
+        self.search_bar.setToolTip(str(error) if error is not None else "")
+        self.rank_matches()
+
+    def rank_matches(self):
+        # Matches are sorted by rank, best first, and nodes by their best match. Without a term rows keep their order.
+        ranks = {}
+        node_ranks = {}
+        if self.search_term:
+            for rank, item in enumerate(self.search_index.get_ranked_items(self.ranked_match_limit)):
+                ranks[item] = rank
+                node_ranks.setdefault(item[0], rank)
+        self.proxy_model.set_ranks(ranks, node_ranks)
+
+    def go_to_best_match(self):
+        # Scrolling to the best match expands its node, so it is only done when asked for.
+        best_matches = self.search_index.get_ranked_items(1) if self.search_term else []
+        if best_matches:
+            node, row = best_matches[0]
+            index = self.proxy_model.mapFromSource(self.model.index(row, 0, self.model.get_node_index(node)))
+            self.tree_widget.scrollTo(index)
+            self.tree_widget.setCurrentIndex(index)
+
+    def set_row_hidden(self, source_index, hidden):
+        index = self.proxy_model.mapFromSource(source_index)
+        self.tree_widget.setRowHidden(index.row(), index.parent(), hidden)
+
+    def index_node(self, node):
+        # Attribute rows are indexed by node and row under the "node.attribute" path they are searched by. Matches of
+        # nodes indexed during a search are ranked by the next search.
+        attribute_rows = self.model.attribute_rows[node]
+        self.search_index.add_group(node, [((node, row), self.model.get_title(node) + "." + attribute.title)
+                                           for row, attribute in enumerate(attribute_rows)])
+        if self.search_term:
+            node_index = self.model.get_node_index(node)
+            for row in range(len(attribute_rows)):
+                self.set_row_hidden(self.model.index(row, 0, node_index), not self.search_index.is_match((node, row)))
+            self.update_node_visibility(node)
+
+    def unindex_nodes(self, nodes):
+        for node in nodes:
+            self.search_index.remove_group(node)
+
+    def update_node_visibility(self, node):
+        # Nodes whose attributes are still loading stay visible until they can be searched.
+        hidden = bool(self.search_term) and self.search_index.is_indexed(node) and \
+            self.search_index.get_match_count(node) == 0
+        self.set_row_hidden(self.model.get_node_index(node), hidden)
 
     def get_selected_entries(self, parents=False):
         data = set()
-        selected_items = self.tree_widget.selectedItems()
-        for item in selected_items:
-            entry = item.data(0, QtCore.Qt.UserRole)
+        selected_indexes = self.tree_widget.selectionModel().selectedIndexes()
+        for index in selected_indexes:
+            index = self.proxy_model.mapToSource(index)
+            entry = self.model.get_entry(index)
             if isinstance(entry, AttributeEntry):
-                parent_item = item.parent()
-                parent_entry = parent_item.data(0, QtCore.Qt.UserRole)
+                parent_entry = self.model.get_entry(index.parent())
                 entry.parent = parent_entry
                 if parents is True and parent_entry not in data:
                     data.add(parent_entry)
@@ -149,26 +254,39 @@ class Explorer(QtWidgets.QWidget):
 
     def set_show_non_keyable_enabled(self, state):
         self.show_non_keyable_enabled = state
-        self.refresh()
+        self.refilter()
 
     def set_show_connected_only_enabled(self, state):
         self.show_connected_only_enabled = state
-        self.refresh()
+        self.refilter()
 
     def set_show_hidden_enabled(self, state):
         self.show_hidden_enabled = state
-        self.refresh()
+        self.refilter()
 
     def on_item_selection_changed(self):
-        selected_items = self.tree_widget.selectedItems()
-        if len(selected_items) > 0:
+        selected_indexes = self.tree_widget.selectionModel().selectedIndexes()
+        if len(selected_indexes) > 0:
             self.selection_activated.emit()
 
+    def on_search_bar_return_pressed(self):
+        self.go_to_best_match()
+
+    def on_node_name_changed(self, uuid, name):
+        # Nodes can share a uuid, so the name of the listed node is read again rather than taken from the renamed node.
+        node = self.model.get_node(uuid)
+        if node is not None:
+            self.model.set_node_title(node, NodeEntry.get_node_name(node.node))
+
     def on_search_bar_text_edited(self):
         text = self.search_bar.text()
         self.search(text)
 
+    def on_search_mode_field_current_index_changed(self, index):
+        self.search_mode = self.search_mode_field.itemData(index)
+        self.search(self.search_bar.text())
+
     def on_context_menu_requested(self, point):
-        selected_indexes = self.tree_widget.selectedIndexes()
+        selected_indexes = self.tree_widget.selectionModel().selectedIndexes()
         if selected_indexes:
             self.context_menu.popup(self.mapToGlobal(point))
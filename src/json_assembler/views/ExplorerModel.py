@@ -0,0 +1,205 @@
+from PySide2 import QtCore
+
+
+class ExplorerModel(QtCore.QAbstractItemModel):
+
+    # Node entries as top level rows, each with its attribute entries as child rows. Attribute entries are only listed
+    # once their node is expanded, through canFetchMore and fetchMore. Indexes of nodes point to root, and indexes of
+    # attributes point to their node.
+
+    root = object()
+
+    # Emitted with a node when its attribute rows were listed or replaced, and with the nodes whose rows were removed.
+    attribute_rows_changed = QtCore.Signal(object)
+    nodes_removed = QtCore.Signal(list)
+
+    def __init__(self, attribute_filter=None, parent=None):
+        super(ExplorerModel, self).__init__(parent)
+        self.attribute_filter = attribute_filter
+        self.nodes = []
+        self.nodes_by_uuid = {}
+
+        # Rows of nodes, found again after rows have been inserted or removed the first time a row is needed.
+        self.rows_by_node = None
+
+        # Every attribute entry of each fetched node, and the attribute entries passing the filter shown as its rows.
+        self.attribute_entries = {}
+        self.attribute_rows = {}
+
+        # Names of renamed nodes. Node entries are shared with files, whose titles are left as they are.
+        self.node_titles = {}
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        elif not parent.isValid():
+            return self.createIndex(row, column, self.root)
+        else:
+            return self.createIndex(row, column, self.nodes[parent.row()])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        node = index.internalPointer()
+        if node is self.root:
+            return QtCore.QModelIndex()
+        return self.createIndex(self.get_node_row(node), 0, self.root)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self.nodes)
+        elif parent.internalPointer() is self.root:
+            return len(self.attribute_rows.get(self.nodes[parent.row()], ()))
+        else:
+            return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        # Nodes show as expandable until fetching their attributes shows otherwise.
+        if not parent.isValid():
+            return bool(self.nodes)
+        elif parent.internalPointer() is self.root:
+            node = self.nodes[parent.row()]
+            return node not in self.attribute_rows or bool(self.attribute_rows[node])
+        else:
+            return False
+
+    def canFetchMore(self, parent):
+        return parent.isValid() and parent.internalPointer() is self.root and \
+            self.nodes[parent.row()] not in self.attribute_rows
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            node = self.nodes[parent.row()]
+            self.attribute_entries[node] = node.get_attribute_entries()
+            self.insert_attribute_rows(node, parent)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.get_entry(index)
+        if role == QtCore.Qt.DisplayRole:
+            return self.get_title(entry)
+        elif role == QtCore.Qt.UserRole:
+            return entry
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def get_entry(self, index):
+        node = index.internalPointer()
+        if node is self.root:
+            return self.nodes[index.row()]
+        return self.attribute_rows[node][index.row()]
+
+    def get_title(self, entry):
+        return self.node_titles.get(entry, entry.title)
+
+    def get_node(self, uuid):
+        return self.nodes_by_uuid.get(uuid)
+
+    def get_node_row(self, node):
+        if self.rows_by_node is None:
+            self.rows_by_node = dict([(x, row) for row, x in enumerate(self.nodes)])
+        return self.rows_by_node[node]
+
+    def get_node_index(self, node):
+        return self.index(self.get_node_row(node), 0)
+
+    def is_listed(self, node):
+        return self.nodes_by_uuid.get(node.uuid) is node
+
+    def is_fetched(self, node):
+        return node in self.attribute_rows
+
+    def fetch_node(self, node):
+        self.fetchMore(self.get_node_index(node))
+
+    def update_nodes(self, uuids, create_node):
+        # Diff the given node uuids against the listed nodes. Nodes no longer given are removed a run of rows at a
+        # time, and entries are only created, through create_node, for the uuids of nodes not listed yet. Nodes given
+        # again keep their rows along with their fetched attributes and expanded state. Returns the added nodes.
+        given_uuids = set(uuids)
+        removed_rows = sorted([self.get_node_row(self.nodes_by_uuid[x])
+                               for x in set(self.nodes_by_uuid).difference(given_uuids)])
+        while removed_rows:
+            last_row = removed_rows.pop()
+            first_row = last_row
+            while removed_rows and removed_rows[-1] == first_row - 1:
+                first_row = removed_rows.pop()
+            self.remove_node_rows(first_row, last_row)
+
+        added_uuids = given_uuids.difference(self.nodes_by_uuid)
+        if not added_uuids:
+            return []
+        added_nodes = []
+        for uuid in uuids:
+            if uuid in added_uuids:
+                # Nodes selected more than once, or sharing a uuid, are only listed once.
+                added_uuids.remove(uuid)
+                node = create_node(uuid)
+                self.nodes_by_uuid[uuid] = node
+                added_nodes.append(node)
+        self.beginInsertRows(QtCore.QModelIndex(), len(self.nodes), len(self.nodes) + len(added_nodes) - 1)
+        if self.rows_by_node is not None:
+            for row, node in enumerate(added_nodes, len(self.nodes)):
+                self.rows_by_node[node] = row
+        self.nodes.extend(added_nodes)
+        self.endInsertRows()
+        return added_nodes
+
+    def remove_node_rows(self, first_row, last_row):
+        self.beginRemoveRows(QtCore.QModelIndex(), first_row, last_row)
+        removed_nodes = self.nodes[first_row:last_row + 1]
+        for node in removed_nodes:
+            del self.nodes_by_uuid[node.uuid]
+            self.attribute_entries.pop(node, None)
+            self.attribute_rows.pop(node, None)
+            self.node_titles.pop(node, None)
+            if self.rows_by_node is not None:
+                del self.rows_by_node[node]
+        # Rows only need to be found again when rows followed those removed.
+        if last_row + 1 < len(self.nodes):
+            self.rows_by_node = None
+        del self.nodes[first_row:last_row + 1]
+        self.endRemoveRows()
+        self.nodes_removed.emit(removed_nodes)
+
+    def set_node_title(self, node, title):
+        self.node_titles[node] = title
+        index = self.get_node_index(node)
+        self.dataChanged.emit(index, index)
+        if node in self.attribute_rows:
+            self.attribute_rows_changed.emit(node)
+
+    def refilter(self):
+        # Attribute rows of fetched nodes are replaced by those passing the current filter.
+        for node in self.nodes:
+            if node in self.attribute_rows:
+                parent = self.get_node_index(node)
+                self.remove_attribute_rows(node, parent)
+                self.insert_attribute_rows(node, parent)
+
+    def insert_attribute_rows(self, node, parent):
+        rows = [x for x in self.attribute_entries[node] if self.attribute_filter is None or self.attribute_filter(x)]
+        if rows:
+            self.beginInsertRows(parent, 0, len(rows) - 1)
+            self.attribute_rows[node] = rows
+            self.endInsertRows()
+        else:
+            self.attribute_rows[node] = rows
+        self.attribute_rows_changed.emit(node)
+
+    def remove_attribute_rows(self, node, parent):
+        rows = self.attribute_rows[node]
+        if rows:
+            self.beginRemoveRows(parent, 0, len(rows) - 1)
+            del self.attribute_rows[node]
+            self.endRemoveRows()
+        else:
+            del self.attribute_rows[node]
@@ -0,0 +1,38 @@
+from PySide2 import QtCore
+
+from ExplorerModel import ExplorerModel
+
+
+class ExplorerProxyModel(QtCore.QSortFilterProxyModel):
+
+    # Sorts the rows of an ExplorerModel by the rank of their search match. Attributes are ordered by their own rank
+    # and nodes by the rank of their best attribute, while unranked rows follow in their own order. Rows are only
+    # sorted while there are ranks, and otherwise keep the order of the source model.
+
+    def __init__(self, parent=None):
+        super(ExplorerProxyModel, self).__init__(parent)
+        self.ranks = {}
+        self.node_ranks = {}
+
+    def set_ranks(self, ranks, node_ranks):
+        # Ranks of (node, row) attribute rows and of nodes, lowest first.
+        self.ranks = ranks
+        self.node_ranks = node_ranks
+        if not ranks:
+            if self.sortColumn() != -1:
+                self.sort(-1)
+        elif self.sortColumn() == 0:
+            self.invalidate()
+        else:
+            self.sort(0)
+
+    def get_rank(self, index):
+        node = index.internalPointer()
+        if node is ExplorerModel.root:
+            rank = self.node_ranks.get(self.sourceModel().nodes[index.row()])
+        else:
+            rank = self.ranks.get((node, index.row()))
+        return rank is None, rank, index.row()
+
+    def lessThan(self, left, right):
+        return self.get_rank(left) < self.get_rank(right)
@@ -93,8 +93,8 @@ class OutlinerTreeWidget(QtWidgets.QTreeView):
         entries = internal_entries.union(external_entries)
 
         # Get the children of each entry.
-        map(lambda x: entries.update(self.file.get_children(x)), internal_entries)
-        map(lambda x: entries.update(self.file.get_children(x)), external_entries)
+        for entry in list(entries):
+            entries.update(self.file.get_children(entry))
 
         # Remove entries and associated items.
         for entry in entries:
@@ -121,15 +121,11 @@ class OutlinerTreeWidget(QtWidgets.QTreeView):
 
     def update_entry_parent(self, item, parent):
         entry = item.data()
-        entry.parent = parent.data()
-        self.file.entries.remove(entry)
-        self.file.entries.add(entry)
+        self.file.set_entry_parent(entry, parent.data())
 
     def update_entry_position(self, item, position):
         entry = item.data()
-        entry.position = position
-        self.file.entries.remove(entry)
-        self.file.entries.add(entry)
+        self.file.set_entry_position(entry, position)
 
     def update_entry_positions_by_parent(self, parent):
         for row in range(parent.rowCount()):
@@ -213,6 +209,7 @@ class OutlinerTreeWidget(QtWidgets.QTreeView):
         if result == QtWidgets.QDialog.Accepted:
             item.setData(dialog.entry)
             item.setText(dialog.entry.title)
+            self.file.update_entry(dialog.entry)
             self.outliner.updated.emit()
 
     def move_up(self):
@@ -25,7 +25,7 @@ class MayaTestCase(unittest.TestCase):
         temp_dir = os.path.join(tempfile.gettempdir(), "unit_test", str(uuid.uuid4()))
         if not os.path.exists(temp_dir):
             os.makedirs(temp_dir)
-        base_name, ext = os.path.splittext(file_name)
+        base_name, ext = os.path.splitext(file_name)
         path = "{0}/{1}{2}".format(temp_dir, base_name, ext)
         count = 0
         while os.path.exists(path):
@@ -2,6 +2,7 @@ import maya.cmds as cmds
 import maya.OpenMaya as om
 
 from AttributeEntry import AttributeEntry
+from File import File
 import maya_utilities
 
 from MayaTestCase import MayaTestCase
@@ -33,6 +34,14 @@ class EntryTests(MayaTestCase):
         entry_b = self.attribute_entry_from_name(node_name, attribute_name)
         self.assertTrue(entry_b in entries)
 
+    def test_attribute_entry_identity(self):
+        attribute_name = "translateX"
+        entry_a = self.attribute_entry_from_name("front", attribute_name)
+        entry_b = self.attribute_entry_from_name("side", attribute_name)
+        self.assertNotEqual(entry_a, entry_b)
+        self.assertEqual(entry_a.key, (entry_a.node_uuid, attribute_name))
+        self.assertEqual(entry_a, self.attribute_entry_from_name("front", attribute_name))
+
     def test_attribute_entry_value(self):
         node_name = "side"
         attribute_name = "translateX"
@@ -47,6 +56,18 @@ class EntryTests(MayaTestCase):
         entry = self.attribute_entry_from_name(node_name, attribute_name)
         self.assertEqual(len(entry.value), 3)
 
+    def test_attribute_entry_nested_compound_value(self):
+        node_name = "persp"
+        attribute_name = "rotatePivotTranslate"
+        cmds.setAttr("%s.%s" % (node_name, attribute_name), 1.0, 2.0, 3.0)
+        try:
+            entry = self.attribute_entry_from_name(node_name, attribute_name)
+            self.assertEqual(list(entry.value.keys()), ["rotatePivotTranslateX", "rotatePivotTranslateY",
+                                                        "rotatePivotTranslateZ"])
+            self.assertEqual(list(entry.value.values()), [1.0, 2.0, 3.0])
+        finally:
+            cmds.setAttr("%s.%s" % (node_name, attribute_name), 0.0, 0.0, 0.0)
+
     def test_attribute_entry_numeric_value(self):
         node_name = "side"
         attribute_name = "caching"
@@ -70,3 +91,132 @@ class EntryTests(MayaTestCase):
         cmds.setAttr("%s.%s" % (node_name, attribute_name), attribute_value)
         entry = self.attribute_entry_from_name(node_name, attribute_name)
         self.assertEqual(entry.value, attribute_value)
+
+    def test_attribute_entry_reader_cached(self):
+        node_name = "top"
+        attribute_name = "translateY"
+        AttributeEntry.clear_descriptors()
+        entry = self.attribute_entry_from_name(node_name, attribute_name)
+        self.assertTrue(("transform", attribute_name) in AttributeEntry.descriptors)
+        cmds.setAttr("%s.%s" % (node_name, attribute_name), 12)
+        self.assertEqual(self.attribute_entry_from_name(node_name, attribute_name).value, 12)
+        self.assertEqual(entry.get_value(), 12)
+
+    def test_attribute_entry_lazy_value(self):
+        node_name = "top"
+        attribute_name = "translateZ"
+        cmds.setAttr("%s.%s" % (node_name, attribute_name), 1)
+        entry = self.attribute_entry_from_name(node_name, attribute_name)
+        self.assertFalse(entry.is_value_read())
+        cmds.setAttr("%s.%s" % (node_name, attribute_name), 2)
+        self.assertEqual(entry.value, 2)
+        self.assertTrue(entry.is_value_read())
+        cmds.setAttr("%s.%s" % (node_name, attribute_name), 3)
+        self.assertEqual(entry.value, 2)
+        self.assertEqual(entry.refresh_value(), 3)
+        entry.invalidate_value()
+        self.assertFalse(entry.is_value_read())
+
+    def test_attribute_entry_node_descriptors_shared(self):
+        AttributeEntry.clear_descriptors()
+        front_fn = om.MFnDependencyNode(self.attribute_entry_from_name("front", "visibility").node)
+        side_fn = om.MFnDependencyNode(self.attribute_entry_from_name("side", "visibility").node)
+        front_descriptors = AttributeEntry.get_node_descriptors(front_fn)
+        side_descriptors = AttributeEntry.get_node_descriptors(side_fn)
+        self.assertEqual(len(front_descriptors), front_fn.attributeCount())
+        self.assertTrue(all(x is y for x, y in zip(front_descriptors, side_descriptors)))
+
+    def test_attribute_entry_node_descriptors_dynamic(self):
+        node_name = "side"
+        attribute_name = "descriptorTest"
+        side_fn = om.MFnDependencyNode(self.attribute_entry_from_name(node_name, "visibility").node)
+        attribute_count = len(AttributeEntry.get_node_descriptors(side_fn))
+        cmds.addAttr(node_name, longName=attribute_name, attributeType="double")
+        try:
+            descriptors = AttributeEntry.get_node_descriptors(side_fn)
+            self.assertEqual(len(descriptors), attribute_count + 1)
+            self.assertEqual(descriptors[-1].partial_name, attribute_name)
+            self.assertTrue(descriptors[-1].dynamic)
+        finally:
+            cmds.deleteAttr(node_name, attribute=attribute_name)
+
+    def test_attribute_entry_matrix_value(self):
+        node_name = "persp"
+        attribute_name = "matrix"
+        entry = self.attribute_entry_from_name(node_name, attribute_name)
+        self.assertEqual(entry.value.shape, (4, 4))
+        self.assertEqual(entry.value[3][3], 1.0)
+        AttributeEntry.flatten_matrices = True
+        try:
+            self.assertEqual(entry.refresh_value().shape, (16,))
+        finally:
+            AttributeEntry.flatten_matrices = False
+
+    def test_attribute_entry_array_value(self):
+        node_name = "persp"
+        attribute_name = "worldMatrix"
+        entry = self.attribute_entry_from_name(node_name, attribute_name)
+        self.assertTrue(entry.is_array_attribute())
+        self.assertEqual(entry.value.shape, (1, 4, 4))
+        self.assertEqual(entry.get_elements(1).shape, (0, 4, 4))
+
+    def test_attribute_entry_refresh_in_file(self):
+        entry = self.attribute_entry_from_name("persp", "translateX")
+        json_file = File()
+        json_file.add_entry(entry)
+        value = cmds.getAttr("persp.translateX")
+        try:
+            json_file.encode(False, 4)
+            cmds.setAttr("persp.translateX", value + 1.5)
+            entry.refresh_value()
+            json_file.update_entry(entry)
+            self.assertEqual(json_file.encode(False, 4), '{"translateX": ' + repr(value + 1.5) + '}')
+            AttributeEntry.sample([entry], [1.0])
+            json_file.update_entries([entry])
+            self.assertEqual(json_file.encode(False, 4), '{"translateX": [' + repr(value + 1.5) + ']}')
+        finally:
+            cmds.setAttr("persp.translateX", value)
+
+    def test_attribute_entry_sparse_array_value(self):
+        node_name = "persp"
+        attribute_name = "sparseArray"
+        cmds.addAttr(node_name, longName=attribute_name, attributeType="double", multi=True)
+        try:
+            cmds.setAttr(node_name + "." + attribute_name + "[2]", 1.5)
+            cmds.setAttr(node_name + "." + attribute_name + "[5]", 2.5)
+            entry = self.attribute_entry_from_name(node_name, attribute_name)
+            self.assertEqual(entry.value["indices"], [2, 5])
+            self.assertEqual(entry.value["values"], [1.5, 2.5])
+            self.assertEqual(entry.get_elements(-1)["values"], [2.5])
+        finally:
+            cmds.deleteAttr(node_name, attribute=attribute_name)
+
+    def test_attribute_entry_mesh_geometry(self):
+        node_name = cmds.polyCube()[0]
+        shape_name = cmds.listRelatives(node_name, shapes=True)[0]
+        AttributeEntry.export_geometry = True
+        try:
+            entry = self.attribute_entry_from_name(shape_name, "outMesh")
+            self.assertEqual(entry.value.get_component("points").shape, (8, 3))
+            self.assertEqual(entry.value.get_component("faceVertexCounts"), [4] * 6)
+            self.assertEqual(entry.value.get_component("faceVertexIndices").size, 24)
+            self.assertEqual(entry.value.get_component("uvCounts"), [4] * 6)
+        finally:
+            AttributeEntry.export_geometry = False
+            cmds.delete(node_name)
+
+    def test_attribute_entry_sample_value(self):
+        node_name = cmds.spaceLocator()[0]
+        cmds.setKeyframe(node_name, attribute="translateX", time=1, value=0.0, inTangentType="linear",
+                         outTangentType="linear")
+        cmds.setKeyframe(node_name, attribute="translateX", time=11, value=10.0, inTangentType="linear",
+                         outTangentType="linear")
+        try:
+            entry = self.attribute_entry_from_name(node_name, "translateX")
+            samples = entry.sample_value([1, 6, 11])
+            self.assertEqual(samples.typecode, 'd')
+            self.assertEqual(samples, [0.0, 5.0, 10.0])
+            AttributeEntry.sample([entry], [1, 11])
+            self.assertEqual(entry.value, [0.0, 10.0])
+        finally:
+            cmds.delete(node_name)
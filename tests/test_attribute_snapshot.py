@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+from AttributeSnapshot import AttributeSnapshot
+from CborEncoder import CborEncoder
+from Entry import Entry
+from EntryEncoder import EntryEncoder
+from File import File
+from TypedArray import TypedArray
+
+from MayaTestCase import MayaTestCase
+
+
+class AttributeSnapshotTests(MayaTestCase):
+
+    def create_snapshot(self):
+        columns = [("visibility", [True, False]),
+                   ("translateX", [1.5, -2.0]),
+                   ("nodeState", [0, 1]),
+                   ("worldMatrix", [TypedArray('d', range(4), (2, 2)), TypedArray('d', range(4, 8), (2, 2))]),
+                   ("creator", [u"a", None])]
+        return AttributeSnapshot(["front", "side"], ["uuid1", "uuid2"], OrderedDict(columns))
+
+    def test_attribute_snapshot_packs_columns(self):
+        snapshot = self.create_snapshot()
+        self.assertEqual(len(snapshot), 2)
+        self.assertEqual(snapshot.get_column("visibility"), [True, False])
+        self.assertTrue(isinstance(snapshot.get_column("translateX"), TypedArray))
+        self.assertTrue(isinstance(snapshot.get_column("nodeState"), TypedArray))
+        self.assertEqual(snapshot.get_column("worldMatrix").shape, (2, 2, 2))
+        self.assertEqual(snapshot.get_row(1)["worldMatrix"], [[4.0, 5.0], [6.0, 7.0]])
+
+    def test_attribute_snapshot_encode(self):
+        snapshot = self.create_snapshot()
+        expected = ('{"nodes": ["front", "side"], "uuids": ["uuid1", "uuid2"], "attributes": {'
+                    '"visibility": [true, false], "translateX": [1.5, -2.0], "nodeState": [0, 1], '
+                    '"worldMatrix": [[[0.0, 1.0], [2.0, 3.0]], [[4.0, 5.0], [6.0, 7.0]]], "creator": ["a", null]}}')
+        self.assertEqual(EntryEncoder().encode(snapshot), expected)
+        encoder = EntryEncoder(indent=2)
+        self.assertEqual(encoder.encode(snapshot), encoder.encode(snapshot.as_dict()))
+
+    def test_file_encode_snapshot(self):
+        json_file = File()
+        entry = Entry("crowd")
+        entry.value = self.create_snapshot()
+        json_file.add_entry(entry)
+        expected = '{"crowd": ' + EntryEncoder().encode(entry.value) + '}'
+        self.assertEqual(json_file.encode(False, 4), expected)
+        self.assertEqual(json_file.encode(False, 4, "json"), expected)
+        self.assertEqual(json_file.encode(True, 4), "".join(json_file.iterencode(True, 4)))
+        self.assertTrue(b"".join(json_file.iterencode_binary(CborEncoder())).startswith(b"\xa1\x65crowd\xa3"))
+
@@ -0,0 +1,97 @@
+import array
+import io
+
+from CborEncoder import CborEncoder
+from Entry import Entry
+from File import File
+from MessagePackEncoder import MessagePackEncoder
+from TypedArray import TypedArray
+
+from MayaTestCase import MayaTestCase
+
+
+class BinaryEncoderTests(MayaTestCase):
+
+    def create_file(self):
+        json_file = File()
+        parent_entry = Entry("object")
+        parent_entry.value = {}
+        child_entry = Entry("array")
+        child_entry.value = [1, 2]
+        child_entry.parent = parent_entry
+        sibling_entry = Entry("number")
+        sibling_entry.value = 3
+        sibling_entry.position = 1
+        json_file.add_entries([parent_entry, child_entry, sibling_entry])
+        return json_file
+
+    def test_message_pack_encode_scalars(self):
+        encoder = MessagePackEncoder()
+        self.assertEqual(encoder.encode(None), b"\xc0")
+        self.assertEqual(encoder.encode(True), b"\xc3")
+        self.assertEqual(encoder.encode(-1), b"\xff")
+        self.assertEqual(encoder.encode(300), b"\xcd\x01\x2c")
+        self.assertEqual(encoder.encode(1.5), b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00")
+        self.assertEqual(encoder.encode(u"a"), b"\xa1a")
+
+    def test_message_pack_encode_typed_array(self):
+        encoder = MessagePackEncoder()
+        data = array.array('f', [1.0])
+        self.assertEqual(encoder.encode(data), b"\xc7\x05\x01f\x00\x00\x80\x3f")
+        matrix = TypedArray('d', [float(x) for x in range(16)], (4, 4))
+        encoded = encoder.encode(matrix)
+        self.assertEqual(encoded[:3], b"\xc7\x8a\x02")
+        self.assertEqual(encoded[3:14], b"d\x02\x04\x00\x00\x00\x04\x00\x00\x00\x00")
+
+    def test_cbor_encode_scalars(self):
+        encoder = CborEncoder()
+        self.assertEqual(encoder.encode(None), b"\xf6")
+        self.assertEqual(encoder.encode(False), b"\xf4")
+        self.assertEqual(encoder.encode(-1), b"\x20")
+        self.assertEqual(encoder.encode(500), b"\x19\x01\xf4")
+        self.assertEqual(encoder.encode(u"a"), b"\x61a")
+        self.assertEqual(encoder.encode([1, [2]]), b"\x82\x01\x81\x02")
+
+    def test_cbor_encode_typed_array(self):
+        encoder = CborEncoder()
+        data = array.array('B', [1, 2])
+        self.assertEqual(encoder.encode(data), b"\xd8\x40\x42\x01\x02")
+        matrix = TypedArray('i', range(16), (2, 8))
+        encoded = encoder.encode(matrix)
+        self.assertEqual(encoded[:7], b"\xd8\x28\x82\x82\x02\x08\xd8")
+        self.assertEqual(encoded[7:10], b"\x4e\x58\x40")
+
+    def test_encode_plain_lists_as_arrays(self):
+        # Plain lists keep the type of each value however long they are.
+        values = [1, 2, 3.5] + list(range(16))
+        self.assertEqual(MessagePackEncoder().encode(values)[:5], b"\xdc\x00\x13\x01\x02")
+        self.assertEqual(CborEncoder().encode(values)[:4], b"\x93\x01\x02\xfb")
+
+    def test_file_save_to_message_pack_file(self):
+        json_file = self.create_file()
+        expected = b"\x82\xa6object\x81\xa5array\x92\x01\x02\xa6number\x03"
+        self.assertEqual(b"".join(json_file.iterencode_binary(MessagePackEncoder())), expected)
+        path = self.get_temp_filename("test_file_save_to_message_pack_file.msgpack")
+        json_file.save_to_message_pack_file(path)
+        with io.open(path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_file_save_to_cbor_file(self):
+        json_file = self.create_file()
+        expected = b"\xa2\x66object\xa1\x65array\x82\x01\x02\x66number\x03"
+        self.assertEqual(b"".join(json_file.iterencode_binary(CborEncoder())), expected)
+        path = self.get_temp_filename("test_file_save_to_cbor_file.cbor")
+        json_file.save_to_cbor_file(path)
+        with io.open(path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_file_encode_array_children(self):
+        json_file = File()
+        parent_entry = Entry("list")
+        parent_entry.value = []
+        child_entry = Entry("item")
+        child_entry.value = None
+        child_entry.parent = parent_entry
+        json_file.add_entries([parent_entry, child_entry])
+        expected = b"\x81\xa4list\x91\x81\xa4item\xc0"
+        self.assertEqual(b"".join(json_file.iterencode_binary(MessagePackEncoder())), expected)
@@ -0,0 +1,104 @@
+import json
+
+from Entry import Entry
+from File import File
+import encoder_backends
+
+from MayaTestCase import MayaTestCase
+
+
+class EncoderBackendTests(MayaTestCase):
+
+    def create_file(self):
+        json_file = File()
+        parent_entry = Entry("object")
+        parent_entry.value = {}
+        array_entry = Entry("array")
+        array_entry.value = []
+        array_entry.parent = parent_entry
+        for position, value in enumerate([1, 2.5, u"\u00e9t\u00e9", None, True, {"compound": [1, 2, 3]}]):
+            child_entry = Entry("child%d" % position)
+            child_entry.value = value
+            child_entry.parent = array_entry
+            child_entry.position = position
+            json_file.add_entry(child_entry)
+        json_file.add_entries([parent_entry, array_entry])
+        return json_file
+
+    def test_backends_equivalent_output(self):
+        json_file = self.create_file()
+        expected = json_file.encode(False, 4)
+        for name in encoder_backends.get_backend_names():
+            text = json_file.encode(False, 4, name)
+            self.assertEqual(json.loads(text), json.loads(expected), name)
+
+    def test_json_backend_identical_output(self):
+        json_file = self.create_file()
+        self.assertEqual(json_file.encode(False, 4, "json"), json_file.encode(False, 4))
+        self.assertEqual("".join(json_file.iterencode(False, 4, "json")), json_file.encode(False, 4))
+
+    def test_backend_fallback(self):
+        json_file = self.create_file()
+        expected = json_file.encode(False, 4)
+        self.assertEqual(json_file.encode(False, 4, "unavailable"), expected)
+
+    def test_backend_fallback_duplicate_titles(self):
+        json_file = File()
+        for position in range(2):
+            entry = Entry("duplicate")
+            entry.value = position
+            entry.position = position
+            json_file.add_entry(entry)
+        self.assertEqual(json_file.encode(False, 4, "json"), '{"duplicate": 0, "duplicate": 1}')
+
+    def test_backends_non_finite_values(self):
+        json_file = File()
+        for position, value in enumerate([float("nan"), float("inf"), -float("inf"), [1.5, float("nan")]]):
+            entry = Entry("value%d" % position)
+            entry.value = value
+            entry.position = position
+            json_file.add_entry(entry)
+        expected = json_file.encode(False, 4)
+        self.assertEqual(expected, '{"value0": NaN, "value1": Infinity, "value2": -Infinity, "value3": [1.5, NaN]}')
+        for name in encoder_backends.get_backend_names() + ["auto"]:
+            text = json_file.encode(False, 4, name)
+            self.assertEqual(json.dumps(json.loads(text)), json.dumps(json.loads(expected)), name)
+
+    def test_backend_finite_only_fallback(self):
+        json_file = File()
+        entry = Entry("value")
+        entry.value = float("nan")
+        json_file.add_entry(entry)
+        registered_backends = encoder_backends.backends.copy()
+        encoder_backends.backends.clear()
+        try:
+            encoder_backends.register_backend("finite", lambda data: json.dumps(data).replace("NaN", "null"),
+                                              allow_nan=False)
+            encoder_backends.register_backend("accelerated", json.dumps)
+            self.assertEqual(json_file.encode(False, 4, "finite"), '{"value": NaN}')
+            self.assertEqual(json_file.encode(False, 4, "auto"), '{"value": NaN}')
+            entry.value = 1.5
+            self.assertEqual(encoder_backends.encode_tree("auto", json_file.get_tree()), '{"value": 1.5}')
+        finally:
+            encoder_backends.deregister_backend("finite")
+            encoder_backends.deregister_backend("accelerated")
+            encoder_backends.backends.update(registered_backends)
+
+    def test_auto_backend_skips_json(self):
+        json_file = self.create_file()
+        registered_backends = encoder_backends.backends.copy()
+        encoder_backends.backends.clear()
+        try:
+            encoder_backends.backends["json"] = registered_backends["json"]
+            self.assertNotIn("json", encoder_backends.get_accelerated_backend_names())
+            self.assertIsNone(encoder_backends.get_backend("auto"))
+            self.assertIsNone(encoder_backends.encode_tree("auto", json_file.get_tree()))
+            self.assertIsNotNone(encoder_backends.encode_tree("json", json_file.get_tree()))
+            self.assertEqual(json_file.encode(False, 4, "auto"), json_file.encode(False, 4))
+        finally:
+            encoder_backends.backends.clear()
+            encoder_backends.backends.update(registered_backends)
+
+    def test_backend_empty_file(self):
+        json_file = File()
+        self.assertEqual(json_file.encode(False, 4, "json"), "")
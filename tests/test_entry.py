@@ -35,3 +35,23 @@ class EntryTests(MayaTestCase):
         entry = Entry()
         entry.value = False
         self.assertTrue(entry.is_bool())
+
+    def test_entry_equals_itself(self):
+        entry = Entry()
+        self.assertEqual(entry, entry)
+        self.assertFalse(entry != entry)
+        self.assertEqual(hash(entry), hash(entry))
+
+    def test_entries_created_together_differ(self):
+        entries = [Entry() for _ in range(1000)]
+        for entry in entries[1:]:
+            entry.created_at = entries[0].created_at
+        self.assertNotEqual(entries[0], entries[1])
+        self.assertEqual(len(set(entries)), len(entries))
+
+    def test_entry_hash_stable(self):
+        entry = Entry()
+        entries = {entry}
+        entry.title = "renamed"
+        entry.value = 1
+        self.assertIn(entry, entries)
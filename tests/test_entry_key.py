@@ -0,0 +1,22 @@
+from EntryKey import EntryKey
+
+from MayaTestCase import MayaTestCase
+
+
+class EntryKeyTests(MayaTestCase):
+
+    def test_entry_key_fields(self):
+        key = EntryKey("uuid1", "translateX")
+        self.assertEqual(key.uuid, "uuid1")
+        self.assertEqual(key.path, "translateX")
+        self.assertEqual(EntryKey("uuid1").path, None)
+
+    def test_entry_key_equality(self):
+        keys = {EntryKey("uuid1", "translateX"): 1, EntryKey("uuid1"): 2}
+        self.assertEqual(keys[EntryKey("uuid1", "translateX")], 1)
+        self.assertEqual(keys[EntryKey("uuid1")], 2)
+        self.assertNotEqual(EntryKey("uuid1", "translateX"), EntryKey("uuid2", "translateX"))
+
+    def test_entry_key_slots(self):
+        key = EntryKey("uuid1", "translateX")
+        self.assertFalse(hasattr(key, "__dict__"))
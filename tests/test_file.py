@@ -0,0 +1,196 @@
+import bz2
+import gzip
+import io
+import os
+
+from Entry import Entry
+from EntryKey import EntryKey
+from File import File
+
+from MayaTestCase import MayaTestCase
+
+
+class KeyedEntry(Entry):
+
+    # Compares by key, as node and attribute entries do.
+
+    def __init__(self, title, key):
+        super(KeyedEntry, self).__init__(title)
+        self.key = key
+
+    def __eq__(self, other):
+        return isinstance(other, KeyedEntry) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+class FileTests(MayaTestCase):
+
+    def create_file(self):
+        json_file = File()
+        parent_entry = Entry("object")
+        parent_entry.value = {}
+        child_entry = Entry("array")
+        child_entry.value = [1, 2]
+        child_entry.parent = parent_entry
+        sibling_entry = Entry("number")
+        sibling_entry.value = 3
+        sibling_entry.position = 1
+        json_file.add_entries([parent_entry, child_entry, sibling_entry])
+        return json_file
+
+    def test_file_encode_empty(self):
+        json_file = File()
+        self.assertEqual(json_file.encode(True, 4), "")
+
+    def test_file_encode_without_indentation(self):
+        json_file = self.create_file()
+        self.assertEqual(json_file.encode(False, 4), '{"object": {"array": [1, 2]}, "number": 3}')
+
+    def test_file_encode_with_indentation(self):
+        json_file = self.create_file()
+        expected = '{\n    "object": {\n        "array": [\n            1, \n            2\n        ]\n    }, \n    "number": 3\n}'
+        self.assertEqual(json_file.encode(True, 4), expected)
+
+    def test_file_iterencode_chunks(self):
+        json_file = self.create_file()
+        chunks = list(json_file.iterencode(True, 2))
+        self.assertEqual("".join(chunks), json_file.encode(True, 2))
+
+    def test_file_save_to_file(self):
+        json_file = self.create_file()
+        path = self.get_temp_filename("test_file_save_to_file.json")
+        json_file.save_to_file(path, True, 4)
+        with io.open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json_file.encode(True, 4))
+
+    def test_file_encode_collapses_single_values(self):
+        json_file = File()
+        parent_entry = Entry("object")
+        parent_entry.value = {}
+        child_entry = Entry("array")
+        child_entry.value = [[1], []]
+        child_entry.parent = parent_entry
+        json_file.add_entries([parent_entry, child_entry])
+        self.assertEqual(json_file.encode(True, 4), '{"object": {"array": [[1], []]}}')
+
+    def test_file_encode_after_update(self):
+        json_file = self.create_file()
+        json_file.encode(True, 4)
+        entry = [x for x in json_file.entries if x.title == "array"][0]
+        entry.value = [3]
+        json_file.update_entry(entry)
+        self.assertEqual(json_file.encode(False, 4), '{"object": {"array": [3]}, "number": 3}')
+        self.assertEqual(json_file.encode(True, 4), "".join(json_file.iterencode(True, 4)))
+
+    def test_file_encode_after_updating_entries(self):
+        json_file = self.create_file()
+        json_file.encode(False, 4)
+        entries = [x for x in json_file.entries if x.title in ("array", "number")]
+        for entry in entries:
+            entry.value = [4] if entry.title == "array" else 5
+        json_file.update_entries(entries + [Entry("other")])
+        self.assertEqual(json_file.encode(False, 4), '{"object": {"array": [4]}, "number": 5}')
+
+    def test_file_encode_after_move(self):
+        json_file = self.create_file()
+        json_file.encode(False, 4)
+        entry = [x for x in json_file.entries if x.title == "array"][0]
+        json_file.set_entry_parent(entry, None)
+        json_file.set_entry_position(entry, 2)
+        self.assertEqual(json_file.encode(False, 4), '{"object": {}, "number": 3, "array": [1, 2]}')
+
+    def test_file_get_children(self):
+        json_file = self.create_file()
+        parent_entry = [x for x in json_file.entries if x.title == "object"][0]
+        grandchild_entry = Entry("grandchild")
+        grandchild_entry.parent = json_file.get_ordered_children(parent_entry)[0]
+        json_file.add_entry(grandchild_entry)
+        children = json_file.get_children(parent_entry)
+        self.assertEqual(set([x.title for x in children]), set(["array", "grandchild"]))
+
+    def test_file_remove_entries(self):
+        json_file = self.create_file()
+        parent_entry = [x for x in json_file.entries if x.title == "object"][0]
+        json_file.remove_entries([parent_entry] + json_file.get_children(parent_entry))
+        self.assertEqual(json_file.encode(False, 4), '{"number": 3}')
+        self.assertEqual(json_file.get_ordered_children(parent_entry), [])
+
+    def test_file_remove_entry_after_parent_changed(self):
+        json_file = self.create_file()
+        json_file.encode(False, 4)
+        entry = [x for x in json_file.entries if x.title == "array"][0]
+        entry.parent = Entry("other")
+        json_file.remove_entry(entry)
+        self.assertEqual(json_file.encode(False, 4), '{"object": {}, "number": 3}')
+        json_file.add_entry(entry)
+        json_file.set_entry_parent(entry, None)
+        self.assertEqual(json_file.encode(False, 4), '{"object": {}, "array": [1, 2], "number": 3}')
+
+    def test_file_remove_equal_entry(self):
+        json_file = self.create_file()
+        entry = KeyedEntry("node", EntryKey("uuid"))
+        entry.value = 4
+        entry.position = 2
+        json_file.add_entry(entry)
+        json_file.encode(False, 4)
+        json_file.remove_entries([KeyedEntry("node", EntryKey("uuid"))])
+        expected = '{"object": {"array": [1, 2]}, "number": 3}'
+        self.assertEqual(json_file.encode(False, 4), expected)
+        self.assertEqual("".join(json_file.iterencode(False, 4)), expected)
+
+    def test_file_remove_parent_before_child(self):
+        json_file = self.create_file()
+        parent_entry = [x for x in json_file.entries if x.title == "object"][0]
+        child_entry = json_file.get_ordered_children(parent_entry)[0]
+        json_file.remove_entry(parent_entry)
+        self.assertTrue(parent_entry in json_file.nodes_by_parent)
+        json_file.remove_entry(child_entry)
+        self.assertFalse(parent_entry in json_file.nodes_by_parent)
+        self.assertFalse(child_entry in json_file.nodes_by_parent)
+        self.assertEqual(json_file.encode(False, 4), '{"number": 3}')
+
+    def test_file_encode_array_children(self):
+        json_file = File()
+        parent_entry = Entry("array")
+        parent_entry.value = []
+        for position, title in enumerate(["first", "second"]):
+            child_entry = Entry(title)
+            child_entry.value = position
+            child_entry.parent = parent_entry
+            child_entry.position = position
+            json_file.add_entry(child_entry)
+        json_file.add_entry(parent_entry)
+        expected = '{"array": [{"first": 0}, {"second": 1}]}'
+        self.assertEqual("".join(json_file.iterencode(False, 4)), expected)
+        self.assertEqual(json_file.encode(False, 4), expected)
+
+    def test_file_save_to_compressed_file(self):
+        json_file = self.create_file()
+        for extension, open_file in [(".gz", gzip.open), (".bz2", bz2.BZ2File)]:
+            path = self.get_temp_filename("test_file_save_to_compressed_file.json" + extension)
+            json_file.save_to_file(path, True, 4, buffer_size=16)
+            f = open_file(path, 'rb')
+            try:
+                self.assertEqual(f.read().decode('utf-8'), json_file.encode(True, 4))
+            finally:
+                f.close()
+
+    def test_file_save_to_file_is_atomic(self):
+        json_file = self.create_file()
+        path = self.get_temp_filename("test_file_save_to_file_is_atomic.json")
+        json_file.save_to_file(path, False, 4)
+
+        def fail():
+            yield "{"
+            raise ValueError("Encoding failed")
+
+        json_file.iterencode = lambda *args: fail()
+        self.assertRaises(ValueError, json_file.save_to_file, path, True, 4)
+        self.assertEqual(os.listdir(os.path.dirname(path)), [os.path.basename(path)])
+        with io.open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '{"object": {"array": [1, 2]}, "number": 3}')
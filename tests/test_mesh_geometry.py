@@ -0,0 +1,61 @@
+import io
+import json
+
+from CborEncoder import CborEncoder
+from Entry import Entry
+from EntryEncoder import EntryEncoder
+from File import File
+from MeshGeometry import MeshGeometry
+from TypedArray import TypedArray
+
+from MayaTestCase import MayaTestCase
+
+
+class MeshGeometryTests(MayaTestCase):
+
+    def create_geometry(self, reads):
+        # A single triangle, recording the components read.
+        components = [("points", TypedArray('f', [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0], (3, 3))),
+                      ("faceVertexCounts", TypedArray('i', [3])),
+                      ("faceVertexIndices", TypedArray('i', [0, 1, 2]))]
+
+        def get_reader(name, component):
+            def read_component():
+                reads.append(name)
+                return component
+            return read_component
+
+        return MeshGeometry([(name, get_reader(name, component)) for name, component in components])
+
+    def test_mesh_geometry_reads_lazily(self):
+        reads = []
+        geometry = self.create_geometry(reads)
+        self.assertEqual(len(geometry), 3)
+        self.assertEqual(geometry.keys(), ["points", "faceVertexCounts", "faceVertexIndices"])
+        self.assertEqual(reads, [])
+        self.assertEqual(geometry.get_component("faceVertexCounts"), [3])
+        self.assertEqual(reads, ["faceVertexCounts"])
+
+    def test_mesh_geometry_encode(self):
+        reads = []
+        geometry = self.create_geometry(reads)
+        expected = ('{"points": [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], "faceVertexCounts": [3], '
+                    '"faceVertexIndices": [0, 1, 2]}')
+        self.assertEqual(EntryEncoder().encode(geometry), expected)
+        self.assertEqual(reads, ["points", "faceVertexCounts", "faceVertexIndices"])
+        encoder = EntryEncoder(indent=2)
+        self.assertEqual(encoder.encode(geometry), encoder.encode(geometry.as_dict()))
+
+    def test_file_save_mesh_geometry(self):
+        reads = []
+        json_file = File()
+        entry = Entry("mesh")
+        entry.value = self.create_geometry(reads)
+        json_file.add_entry(entry)
+        path = self.get_temp_filename("test_file_save_mesh_geometry.json")
+        json_file.save_to_file(path, True, 4)
+        with io.open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.loads(f.read())["mesh"]["faceVertexIndices"], [0, 1, 2])
+        self.assertEqual(len(reads), 3)
+        self.assertEqual(json_file.encode(False, 4, "json"), json_file.encode(False, 4))
+        self.assertTrue(b"".join(json_file.iterencode_binary(CborEncoder())).startswith(b"\xa1\x64mesh\xa3"))
@@ -20,3 +20,27 @@ class EntryTests(MayaTestCase):
         entries.add(entry_a)
         entry_b = maya_utilities.get_entries_from_selection()[0]
         self.assertTrue(entry_b in entries)
+
+    def test_attribute_snapshot(self):
+        cmds.setAttr("front.translateX", 5)
+        cmds.setAttr("side.translateX", 7)
+        cmds.select(["front", "side"], replace=True)
+        nodes = maya_utilities.get_nodes_from_selection()
+        snapshot = maya_utilities.get_attribute_snapshot(nodes, ["translateX", "visibility", "missingAttribute"])
+        self.assertEqual(snapshot.node_names, ["front", "side"])
+        self.assertEqual(snapshot.get_column("translateX"), [5.0, 7.0])
+        self.assertEqual(snapshot.get_column("visibility"), [True, True])
+        self.assertEqual(snapshot.get_column("missingAttribute"), [None, None])
+
+    def test_node_from_shared_uuid(self):
+        # Imported copies of a node can share its uuid, in which case the selected node is the one found.
+        first_node = cmds.createNode("transform", name="sharedUuidFirst")
+        second_node = cmds.createNode("transform", name="sharedUuidSecond")
+        try:
+            uuid = cmds.ls(first_node, uuid=True)[0]
+            cmds.rename(second_node, uuid, uuid=True)
+            for node_name in [first_node, second_node]:
+                cmds.select(node_name, replace=True)
+                self.assertEqual(NodeEntry.get_node_name(maya_utilities.get_node_from_uuid(uuid)), node_name)
+        finally:
+            cmds.delete(first_node, second_node)
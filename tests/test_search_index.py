@@ -0,0 +1,77 @@
+from SearchIndex import SearchIndex
+
+from MayaTestCase import MayaTestCase
+
+
+class SearchIndexTests(MayaTestCase):
+
+    def create_index(self):
+        search_index = SearchIndex()
+        for node in ["pCube1", "persp"]:
+            search_index.add_group(node, [((node, row), node + "." + attribute)
+                                          for row, attribute in enumerate(["translateX", "rotateX", "visibility"])])
+        return search_index
+
+    def test_search_index_search(self):
+        search_index = self.create_index()
+        self.assertEqual(len(search_index), 6)
+        added_matches, removed_matches = search_index.search("Cube1.T")
+        self.assertEqual(added_matches, [])
+        self.assertEqual(set(removed_matches), set([("pCube1", 1), ("pCube1", 2)] + [("persp", x) for x in range(3)]))
+        self.assertEqual(search_index.get_matching_items(), [("pCube1", 0)])
+        self.assertEqual(search_index.get_match_count("pCube1"), 1)
+        self.assertEqual(search_index.get_match_count("persp"), 0)
+
+    def test_search_index_widen(self):
+        search_index = self.create_index()
+        search_index.search("rotatex")
+        added_matches, removed_matches = search_index.search("x")
+        self.assertEqual(set(added_matches), set([("pCube1", 0), ("persp", 0)]))
+        self.assertEqual(removed_matches, [])
+        self.assertEqual(search_index.get_match_count("persp"), 2)
+
+    def test_search_index_groups(self):
+        search_index = self.create_index()
+        search_index.search("translate")
+        search_index.add_group("side", [(("side", 0), "side.translateY")])
+        self.assertTrue(search_index.is_match(("side", 0)))
+        self.assertEqual(search_index.get_match_count("side"), 1)
+        search_index.remove_group("pCube1")
+        self.assertEqual(set(search_index.get_matching_items()), set([("persp", 0), ("side", 0)]))
+        self.assertFalse(search_index.is_indexed("pCube1"))
+        self.assertEqual(set(search_index.search("")[0]), set([("persp", 1), ("persp", 2)]))
+
+    def test_search_index_modes(self):
+        search_index = self.create_index()
+        search_index.search("*.rotate?", "glob")
+        self.assertEqual(set(search_index.get_matching_items()), set([("pCube1", 1), ("persp", 1)]))
+        added_matches, removed_matches = search_index.search("ty", "fuzzy")
+        self.assertEqual(set(added_matches), set([("pCube1", 2), ("persp", 2)]))
+        self.assertEqual(set(removed_matches), set([("pCube1", 1), ("persp", 1)]))
+        search_index.search("^p.*x$", "regex")
+        self.assertEqual(search_index.get_match_count("pCube1"), 2)
+        added_matches, removed_matches = search_index.search("^p.*x$(", "regex")
+        self.assertEqual(added_matches, [])
+        self.assertEqual(search_index.get_matching_items(), [])
+
+    def test_search_index_ranked_items(self):
+        search_index = self.create_index()
+        search_index.search("tx", "fuzzy")
+        self.assertEqual(search_index.get_ranked_items(), [("persp", 1), ("pCube1", 1), ("persp", 0), ("pCube1", 0)])
+        self.assertEqual(search_index.get_ranked_items(1), [("persp", 1)])
+
+    def test_search_index_narrow_large(self):
+        # Terms extending the previous term narrow the previous matches. benchmark_search_index.py times this.
+        search_index = SearchIndex()
+        for node_index in range(1000):
+            node = "node%d" % node_index
+            search_index.add_group(node, [((node, row), "%s.attribute%d" % (node, row)) for row in range(100)])
+        self.assertEqual(len(search_index), 100000)
+        search_index.search("node12")
+        self.assertEqual(len(search_index.matches), 1100)
+        added_matches, removed_matches = search_index.search("node123")
+        self.assertEqual(added_matches, [])
+        self.assertEqual(len(removed_matches), 1000)
+        self.assertEqual(len(search_index.matches), 100)
+        self.assertEqual(search_index.get_match_count("node123"), 100)
+        self.assertEqual(search_index.get_match_count("node12"), 0)
@@ -0,0 +1,41 @@
+from SearchMatcher import SearchMatcher
+
+from MayaTestCase import MayaTestCase
+
+
+class SearchMatcherTests(MayaTestCase):
+
+    def test_search_matcher_modes(self):
+        path = "pcube1.translatex"
+        self.assertTrue(SearchMatcher("Cube1.T").is_match(path))
+        self.assertFalse(SearchMatcher("cube1.*").is_match(path))
+        self.assertTrue(SearchMatcher("*.translate?", "glob").is_match(path))
+        self.assertFalse(SearchMatcher("*.translate", "glob").is_match(path))
+        self.assertTrue(SearchMatcher("translate", "glob").is_match(path))
+        self.assertTrue(SearchMatcher("TRANSLATE[xyz]$", "regex").is_match(path))
+        self.assertFalse(SearchMatcher("^translate", "regex").is_match(path))
+        self.assertTrue(SearchMatcher("pc1tx", "fuzzy").is_match(path))
+        self.assertFalse(SearchMatcher("ptc", "fuzzy").is_match(path))
+        self.assertRaises(ValueError, SearchMatcher, "translate", "unknown")
+
+    def test_search_matcher_invalid_regex(self):
+        matcher = SearchMatcher("translate[", "regex")
+        self.assertIsNotNone(matcher.error)
+        self.assertFalse(matcher.is_match("pcube1.translate["))
+        self.assertEqual(matcher.get_matches([(0, "pcube1.translate[")]), [])
+
+    def test_search_matcher_narrows(self):
+        self.assertTrue(SearchMatcher("cube1").narrows(SearchMatcher("cube")))
+        self.assertFalse(SearchMatcher("cube").narrows(SearchMatcher("cube1")))
+        self.assertTrue(SearchMatcher("ctx", "fuzzy").narrows(SearchMatcher("cx", "fuzzy")))
+        self.assertTrue(SearchMatcher("cube.tx").narrows(SearchMatcher("ctx", "fuzzy")))
+        self.assertFalse(SearchMatcher("tx", "fuzzy").narrows(SearchMatcher("tx")))
+        self.assertTrue(SearchMatcher("*.tx", "glob").narrows(SearchMatcher()))
+        self.assertFalse(SearchMatcher("*.tx", "glob").narrows(SearchMatcher("*", "glob")))
+        self.assertFalse(SearchMatcher("[", "regex").narrows(SearchMatcher()))
+
+    def test_search_matcher_score(self):
+        matcher = SearchMatcher("tx", "fuzzy")
+        paths = ["pcube1.translatex", "pcube1.tx", "pcube1.matrix", "persp.tx"]
+        self.assertEqual(sorted(paths, key=matcher.get_score),
+                         ["persp.tx", "pcube1.tx", "pcube1.matrix", "pcube1.translatex"])
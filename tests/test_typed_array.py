@@ -0,0 +1,78 @@
+import array
+import sys
+
+from CborEncoder import CborEncoder
+from Entry import Entry
+from EntryEncoder import EntryEncoder
+from File import File
+from TypedArray import TypedArray
+
+from MayaTestCase import MayaTestCase
+
+
+class TypedArrayTests(MayaTestCase):
+
+    def test_typed_array_shape(self):
+        typed_array = TypedArray('d', range(6), (2, 3))
+        self.assertEqual(typed_array.size, 6)
+        self.assertEqual(len(typed_array), 2)
+        self.assertEqual(typed_array.tolist(), [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+        self.assertEqual(typed_array[1], [3.0, 4.0, 5.0])
+        self.assertRaises(ValueError, TypedArray, 'd', range(5), (2, 3))
+
+    def test_typed_array_keeps_buffer(self):
+        values = array.array('f', [1.0, 2.0])
+        typed_array = TypedArray('f', values)
+        self.assertTrue(typed_array.data is values)
+        self.assertEqual(typed_array, [1.0, 2.0])
+
+    def test_typed_array_pack_integers(self):
+        packed = TypedArray.pack([1, 2 ** 40])
+        self.assertEqual(packed.data.itemsize, 8)
+        self.assertEqual(packed, [1, 2 ** 40])
+        # Without a 64 bit type code, as with Python 2 on Windows, integers are left in a list rather than truncated.
+        module = sys.modules[TypedArray.__module__]
+        typecode = module.INT64_TYPECODE
+        module.INT64_TYPECODE = None
+        try:
+            self.assertEqual(TypedArray.pack([1, 2 ** 40]), [1, 2 ** 40])
+            self.assertFalse(isinstance(TypedArray.pack([1, 2 ** 40]), TypedArray))
+        finally:
+            module.INT64_TYPECODE = typecode
+
+    def test_typed_array_encode(self):
+        typed_array = TypedArray('d', [0.5, 1.0, -2.0, 3.25], (2, 2))
+        self.assertEqual(EntryEncoder().encode(typed_array), "[[0.5, 1.0], [-2.0, 3.25]]")
+        encoder = EntryEncoder(indent=2)
+        self.assertEqual(encoder.encode(typed_array), encoder.encode(typed_array.tolist()))
+
+    def test_typed_array_encode_blocks(self):
+        typed_array = TypedArray('i', range(8), (2, 2, 2))
+        self.assertEqual(EntryEncoder().encode(typed_array), "[[[0, 1], [2, 3]], [[4, 5], [6, 7]]]")
+        encoder = EntryEncoder(indent=4)
+        encoder.chunk_size = 1
+        self.assertEqual(encoder.encode(typed_array), encoder.encode(typed_array.tolist()))
+
+    def test_typed_array_encode_non_finite(self):
+        typed_array = TypedArray('d', [float("nan"), float("inf"), 1.0])
+        self.assertEqual(EntryEncoder().encode(typed_array), "[NaN, Infinity, 1.0]")
+        self.assertRaises(ValueError, EntryEncoder(allow_nan=False).encode, typed_array)
+
+    def test_typed_array_encode_in_chunks(self):
+        typed_array = TypedArray('i', range(10))
+        encoder = EntryEncoder()
+        encoder.chunk_size = 3
+        self.assertEqual(encoder.encode(typed_array), "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]")
+
+    def test_file_encode_typed_array(self):
+        json_file = File()
+        entry = Entry("points")
+        entry.value = TypedArray('d', [1, 2, 3, 4, 5, 6], (2, 3))
+        json_file.add_entry(entry)
+        self.assertEqual(json_file.encode(False, 4), '{"points": [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]}')
+        self.assertEqual(json_file.encode(True, 4), "".join(json_file.iterencode(True, 4)))
+        self.assertEqual(json_file.encode(False, 4, "json"), json_file.encode(False, 4))
+
+    def test_typed_array_binary_encode(self):
+        typed_array = TypedArray('B', [1, 2])
+        self.assertEqual(CborEncoder().encode(typed_array), b"\xd8\x40\x42\x01\x02")